@@ -28,14 +28,22 @@ setup(
     ],
     python_requires=">=3.8",
     install_requires=[
-        "streamlit>=1.20.0",
         "anthropic>=0.7.0",
-        "openai>=0.27.0",
+        "openai>=1.26.0",
+        "httpx[http2]>=0.23.0",
+        "tiktoken>=0.5.0",
         "python-dotenv>=0.21.0",
-        "pandas>=1.5.3",
+        "orjson>=3.9.0",
+        "tenacity>=8.2.0",
         "numpy>=1.24.2",
     ],
     extras_require={
+        "ui": [
+            "streamlit>=1.31.0",
+        ],
+        "analysis": [
+            "pandas>=1.5.3",
+        ],
         "dev": [
             "pytest>=7.2.2",
             "pytest-cov>=4.0.0",
@@ -48,9 +56,4 @@ setup(
             "matplotlib>=3.7.1",
         ],
     },
-    entry_points={
-        "console_scripts": [
-            "prompt-playground=src.streamlit_app:main",
-        ],
-    },
 )
\ No newline at end of file
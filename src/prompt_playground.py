@@ -1,36 +1,848 @@
+import io
 import os
+import sys
 import json
-from typing import List, Dict, Any
-from openai import OpenAI
+import time
+import asyncio
+import argparse
+import threading
+import hashlib
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import List, Dict, Any, AsyncIterator, Iterator, Mapping, Optional, Tuple
+import httpx
+import numpy as np
+import orjson
+from openai import OpenAI, AsyncOpenAI, AsyncStream, RateLimitError, APIConnectionError, APITimeoutError
+from openai.types.chat import ChatCompletion, ChatCompletionChunk
 import tiktoken
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_random_exponential
+
+# Ensure output directory exists
+os.makedirs("outputs", exist_ok=True)
+
+# Loading the BPE ranks is expensive, so every playground shares one encoder.
+# The ranks are downloaded on first use; without network access token counts
+# fall back to a character-based estimate
+try:
+    _ENCODER = tiktoken.encoding_for_model("gpt-3.5-turbo")
+except Exception:
+    _ENCODER = None
+
+
+def count_tokens(text: str) -> int:
+    """
+    Count the tokens of a piece of text
+
+    :param text: Text to count
+    :return: Token count (about four characters per token if the encoder is unavailable)
+    """
+    if _ENCODER is None:
+        return (len(text) + 3) // 4
+    return len(_ENCODER.encode(text))
+
+
+def count_messages_tokens(messages: List[Dict[str, str]]) -> int:
+    """
+    Count the prompt tokens of a chat message list
+
+    :param messages: Chat messages
+    :return: Token count including the per-message ChatML overhead and reply priming
+    """
+    return sum(count_tokens(message["content"]) + 4 for message in messages) + 2
+
+
+# Pricing as of 2024 (per 1M tokens)
+_PRICING = {
+    "gpt-3.5-turbo": {"input": 0.50, "output": 1.50},  # Average
+    "gpt-4": {"input": 30.00, "output": 60.00},
+    "gpt-4-turbo": {"input": 10.00, "output": 30.00}
+}
+
+# Use average pricing for simplicity (actual cost varies by input/output ratio)
+_AVG_PRICE_PER_TOKEN = {
+    model: (price["input"] + price["output"]) / 2 / 1_000_000
+    for model, price in _PRICING.items()
+}
+_DEFAULT_PRICE_PER_TOKEN = 1.00 / 1_000_000  # Default fallback
+
+# Batch API requests are billed at half the synchronous rate
+_BATCH_DISCOUNT = 0.5
+
+# Largest prompt sent to gpt-3.5-turbo, leaving room for the completion in its 16k context
+_MAX_PROMPT_TOKENS = 15_000
+
+# Completion budget charged against the token rate per sample when a
+# request sets no max_tokens; roughly a long chat answer
+_DEFAULT_COMPLETION_TOKENS = 512
+
+# Input limit of text-embedding-3-small; longer final turns skip the semantic cache tier
+_MAX_EMBEDDING_TOKENS = 8_191
+
+# Transient API failures (rate limits, dropped connections, timeouts) are
+# retried with jittered exponential backoff instead of surfacing as errors
+_retry_transient = retry(
+    wait=wait_random_exponential(min=1, max=30),
+    stop=stop_after_attempt(6),
+    retry=retry_if_exception_type((RateLimitError, APIConnectionError, APITimeoutError)),
+    reraise=True
+)
+
+# Static instructions live in the system message so every call shares the
+# same prefix; only the user input varies, at the very end
+_COT_SYSTEM = """You are an expert problem solver who explains reasoning clearly.
+Let's solve the problem step by step.
+
+Break down your reasoning into clear, logical steps:
+1. First, identify the key components of the problem.
+2. Then, outline the approach to solve it.
+3. Show the detailed calculation or reasoning.
+4. Provide the final solution."""
+
+_REACT_SYSTEM = """You are an AI assistant that uses the ReAct framework (Reasoning + Acting) to solve problems step by step.
+
+Use the ReAct framework to solve the task:
+1. Thought: What do I need to think about?
+2. Action: What action should I take?
+3. Observation: What did I observe?
+4. (Repeat as needed)
+5. Answer: Final solution
+
+Format your response with clear Thought, Action, and Observation steps."""
+
+_TOT_SYSTEM = """You are an expert at exploring multiple solution paths and selecting the best approach.
+
+Use Tree-of-Thoughts approach:
+1. Generate 3 initial solution approaches
+2. For each approach, evaluate its strengths and weaknesses
+3. Select the most promising approach
+4. Develop that approach with detailed steps
+5. Provide the final solution
+
+Format your response clearly showing:
+- Initial Branches (3 approaches)
+- Evaluation of each branch
+- Selected branch with reasoning
+- Detailed solution"""
+
+_SELF_CONSISTENCY_SYSTEM = """You are an expert problem solver. Think step by step and show your reasoning.
+
+Solve the problem and explain your reasoning, showing your step-by-step thinking process."""
+
+# (system prompt, user prompt) templates for the single-message techniques;
+# each holds at most one {placeholder} filled from the technique's parameters.
+# Fixed instructions come first and the variable part last, so repeated
+# requests share the longest possible prefix for OpenAI's prompt caching
+_TECHNIQUE_TEMPLATES: Dict[str, Tuple[str, str]] = {
+    "Zero-Shot Prompting": ("You are a helpful assistant.", "{prompt}"),
+    "Chain-of-Thought Prompting": (_COT_SYSTEM, "{problem}"),
+    "Role-Playing Prompting": (
+        """Respond as if you were truly in the role below, using appropriate language,
+expertise, and perspective of the assigned persona.
+
+You are a {role}.""",
+        "{task}"
+    ),
+    "Persona-Based Prompting": (
+        """Consider your unique background, knowledge, and communication style.
+Ensure your response reflects the specific perspective of the persona below.
+
+You are a {persona}.""",
+        "{query}"
+    ),
+    "ReAct Prompting": (_REACT_SYSTEM, "{task}"),
+    "Tree-of-Thoughts Prompting": (_TOT_SYSTEM, "{problem}")
+}
+
+
+def _compile_template(template: str) -> Tuple[str, Optional[str], str]:
+    """
+    Pre-split a template around its placeholder so filling it is a plain
+    concatenation rather than a str.format parse on every call
+
+    :param template: Template with at most one ``{field}`` placeholder
+    :return: (prefix, field, suffix), with field None for a constant template
+    """
+    if "{" not in template:
+        return template, None, ""
+
+    prefix, rest = template.split("{", 1)
+    field, suffix = rest.split("}", 1)
+    return prefix, field, suffix
+
+
+def _fill_template(template: Tuple[str, Optional[str], str], params: Dict[str, Any]) -> str:
+    """
+    Fill a template produced by ``_compile_template``
+
+    :param template: (prefix, field, suffix) triple
+    :param params: The technique's parameters
+    :return: Filled prompt text
+    """
+    prefix, field, suffix = template
+    return prefix + params[field] + suffix if field else prefix
+
+
+_TECHNIQUE_CONFIG = {
+    technique: (_compile_template(system_prompt), _compile_template(user_prompt))
+    for technique, (system_prompt, user_prompt) in _TECHNIQUE_TEMPLATES.items()
+}
+
+# Constant system messages are built once and shared by every request. They
+# stay plain dicts so requests remain JSON-serializable for the cache and the
+# Batch API; nothing downstream mutates them
+_SYSTEM_MESSAGES = {
+    technique: {"role": "system", "content": system_prompt}
+    for technique, (system_prompt, _) in _TECHNIQUE_TEMPLATES.items()
+    if "{" not in system_prompt
+}
+_SYS_TRANSLATOR = {"role": "system", "content": "You are a helpful translation assistant."}
+_SYS_SELF_CONSISTENCY = {"role": "system", "content": _SELF_CONSISTENCY_SYSTEM}
+
+_DEFAULT_COMPARE_TECHNIQUES = ("Zero-Shot Prompting", "Few-Shot Prompting", "Chain-of-Thought Prompting")
+
+_DEFAULT_FEW_SHOT_EXAMPLES = [
+    {"input": "Translate to French: Hello", "output": "Bonjour"},
+    {"input": "Translate to French: Goodbye", "output": "Au revoir"}
+]
+
+# Static template library shared by every playground; read-only so it can be
+# handed out without defensive copies
+_PROMPT_TEMPLATES = MappingProxyType({
+    "Translation": MappingProxyType({
+        "Simple": "Translate the following text to {language}: {text}",
+        "Formal": "Provide a formal translation of this text to {language}, maintaining professional tone: {text}",
+        "Context": "Translate this {context} text to {language}: {text}"
+    }),
+    "Summarization": MappingProxyType({
+        "Brief": "Summarize this in 2-3 sentences: {text}",
+        "Bullet Points": "Summarize the key points as a bullet list: {text}",
+        "Executive": "Provide an executive summary highlighting main insights: {text}"
+    }),
+    "Code": MappingProxyType({
+        "Explain": "Explain what this code does in simple terms: {code}",
+        "Debug": "Find and explain the bug in this code: {code}",
+        "Optimize": "Suggest optimizations for this code: {code}",
+        "Convert": "Convert this code from {from_lang} to {to_lang}: {code}"
+    }),
+    "Creative Writing": MappingProxyType({
+        "Story": "Write a {length} story about {topic} in the style of {style}",
+        "Poem": "Write a {type} poem about {topic}",
+        "Dialogue": "Write a dialogue between {character1} and {character2} about {topic}"
+    }),
+    "Analysis": MappingProxyType({
+        "Pros and Cons": "Analyze the pros and cons of {topic}",
+        "Compare": "Compare and contrast {item1} and {item2}",
+        "SWOT": "Perform a SWOT analysis of {topic}"
+    }),
+    "Business": MappingProxyType({
+        "Email": "Write a {tone} email about {topic} to {recipient}",
+        "Proposal": "Draft a business proposal for {project}",
+        "Report": "Create an executive report on {topic}"
+    })
+})
+
+
+def _error_result(error: Exception) -> Dict[str, Any]:
+    """
+    Describe a failed request in the same shape as a successful result
+
+    :param error: The exception that ended the request
+    :return: Dict with error, error_type, and zero tokens and cost
+    """
+    return {
+        "error": str(error),
+        "error_type": type(error).__name__,
+        "tokens": 0,
+        "cost": 0.0
+    }
+
+
+# Slotted dataclasses need Python 3.10; older interpreters get a plain one
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
+class DemoResult:
+    """
+    Outcome of one demonstration run
+    """
+    technique: str
+    input: Dict[str, Any]
+    response: Optional[str] = None
+    tokens: int = 0
+    cost: float = 0.0
+    error: Optional[str] = None
+    error_type: Optional[str] = None
+    num_paths: Optional[int] = None
+
+    @classmethod
+    def from_output(cls, technique: str, params: Dict[str, Any], output: Dict[str, Any]) -> "DemoResult":
+        """
+        Build a demonstration result from a technique's result dict
+
+        :param technique: Technique name
+        :param params: The technique's parameters
+        :param output: Result dict, successful or from ``_error_result``
+        :return: Demonstration result
+        """
+        return cls(
+            technique=technique,
+            input=params,
+            response=output.get("response"),
+            tokens=output.get("tokens", 0),
+            cost=output.get("cost", 0.0),
+            error=output.get("error"),
+            error_type=output.get("error_type"),
+            num_paths=output.get("num_paths")
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Serialize in the {"technique", "input", "output"} shape of the demonstration log
+
+        :return: JSON-serializable dict
+        """
+        if self.error is None:
+            output = {"response": self.response, "tokens": self.tokens, "cost": self.cost}
+        else:
+            output = {"error": self.error, "error_type": self.error_type, "tokens": self.tokens, "cost": self.cost}
+        if self.num_paths is not None:
+            output["num_paths"] = self.num_paths
+
+        return {"technique": self.technique, "input": self.input, "output": output}
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: float):
+        """
+        Token bucket that paces spending against a per-minute budget
+
+        :param rate: Tokens replenished per second
+        :param capacity: Maximum tokens that can be spent in a burst
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    async def acquire(self, amount: float):
+        """
+        Wait until ``amount`` tokens are available, then spend them
+
+        :param amount: Units (requests or tokens) the upcoming call will spend
+        """
+        amount = min(amount, self.capacity)
+        while True:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+
+            if self.tokens >= amount:
+                self.tokens -= amount
+                return
+
+            await asyncio.sleep((amount - self.tokens) / self.rate)
+
+
+class ThrottledOpenAIExecutor:
+    def __init__(self, client: AsyncOpenAI, max_requests_per_minute: int,
+                 max_tokens_per_minute: int, max_concurrency: int):
+        """
+        Gate chat completion and embedding calls behind concurrency, request-rate and token-rate limits
+
+        :param client: Async OpenAI client that issues the requests
+        :param max_requests_per_minute: Requests-per-minute budget
+        :param max_tokens_per_minute: Tokens-per-minute budget
+        :param max_concurrency: Maximum requests in flight at once
+        """
+        self.client = client
+        self.max_concurrency = max_concurrency
+        self._sem = None  # created on first use, inside the loop that will await it
+        self._requests = TokenBucket(rate=max_requests_per_minute / 60, capacity=max_requests_per_minute)
+        self._tokens = TokenBucket(rate=max_tokens_per_minute / 60, capacity=max_tokens_per_minute)
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+    async def create(self, prompt_tokens: int, request_key: Optional[str] = None, **kwargs) -> ChatCompletion:
+        """
+        Send a chat completion request, sharing the response with any identical
+        request already in flight instead of issuing a duplicate call
+
+        :param prompt_tokens: Token count of the request's messages
+        :param request_key: Digest identifying the request exactly, if the
+            caller already has one; computed from ``kwargs`` otherwise
+        :param kwargs: Arguments for ``chat.completions.create``
+        :return: Chat completion response
+        """
+        key = request_key or hashlib.blake2b(json.dumps(kwargs, sort_keys=True).encode()).hexdigest()
+        task = self._inflight.get(key)
+        if task is None:
+            # The call runs as its own task, so cancelling whichever caller
+            # started it does not cancel it for the others
+            task = asyncio.ensure_future(self._send(prompt_tokens, **kwargs))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._settle(key, done))
+
+        # Shielded so a cancelled caller does not cancel the shared call
+        return await asyncio.shield(task)
+
+    def _settle(self, key: str, task: asyncio.Task):
+        """
+        Forget a finished shared call
+
+        :param key: Digest the call was registered under
+        :param task: The finished call
+        """
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark the outcome retrieved even if every caller was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    @_retry_transient
+    async def _send(self, prompt_tokens: int, **kwargs) -> ChatCompletion:
+        """
+        Send a chat completion request once both budgets allow it, retrying transient failures
+
+        :param prompt_tokens: Token count of the request's messages
+        :param kwargs: Arguments for ``chat.completions.create``
+        :return: Chat completion response
+        """
+        if self._sem is None:
+            self._sem = asyncio.Semaphore(self.max_concurrency)
+
+        async with self._sem:
+            await self._acquire_budget(prompt_tokens, kwargs)
+            return await self.client.chat.completions.create(**kwargs)
+
+    async def stream(self, prompt_tokens: int, **kwargs) -> AsyncIterator[ChatCompletionChunk]:
+        """
+        Stream a chat completion under the same limits and retry policy as ``create``
+
+        :param prompt_tokens: Token count of the request's messages
+        :param kwargs: Arguments for ``chat.completions.create``
+        :return: Async iterator over completion chunks; the last one carries the usage
+        """
+        if self._sem is None:
+            self._sem = asyncio.Semaphore(self.max_concurrency)
+
+        # The slot taken by _open_stream is held until the stream is finished
+        stream = await self._open_stream(prompt_tokens, **kwargs)
+        try:
+            async for chunk in stream:
+                yield chunk
+        finally:
+            try:
+                await stream.close()
+            finally:
+                self._sem.release()
+
+    @_retry_transient
+    async def _open_stream(self, prompt_tokens: int, **kwargs) -> AsyncStream[ChatCompletionChunk]:
+        """
+        Open a streamed chat completion once both budgets allow it; only opening
+        is retried, so no fragment is ever delivered twice
+
+        :param prompt_tokens: Token count of the request's messages
+        :param kwargs: Arguments for ``chat.completions.create``
+        :return: The open stream, holding a concurrency slot the caller must release
+        """
+        # The slot is taken per attempt, as in _send, so a retry backing off
+        # does not hold it while it waits
+        await self._sem.acquire()
+        try:
+            await self._acquire_budget(prompt_tokens, kwargs)
+            return await self.client.chat.completions.create(
+                **kwargs, stream=True, stream_options={"include_usage": True}
+            )
+        except BaseException:
+            self._sem.release()
+            raise
+
+    async def embed(self, **kwargs):
+        """
+        Create an embedding under the concurrency and request-rate limits.
+        Embeddings only feed the optional semantic cache lookup, so a failure
+        is not retried; the caller treats it as a cache miss
+
+        :param kwargs: Arguments for ``embeddings.create``
+        :return: Embedding response
+        """
+        if self._sem is None:
+            self._sem = asyncio.Semaphore(self.max_concurrency)
+
+        # Embedding tokens are metered separately from chat tokens, so only
+        # the request budget is spent here
+        async with self._sem:
+            await self._requests.acquire(1)
+            return await self.client.embeddings.create(**kwargs)
+
+    async def _acquire_budget(self, prompt_tokens: int, kwargs: Dict[str, Any]):
+        """
+        Wait until the request- and token-rate budgets cover one request
+
+        :param prompt_tokens: Token count of the request's messages
+        :param kwargs: Arguments for ``chat.completions.create``
+        """
+        # Rate limits count the requested completion budget, not just the
+        # prompt, and an n-sample request may spend it once per sample
+        completion_tokens = kwargs.get("max_tokens") or _DEFAULT_COMPLETION_TOKENS
+        await self._requests.acquire(1)
+        await self._tokens.acquire(prompt_tokens + kwargs.get("n", 1) * completion_tokens)
+
+
+class SemanticCache:
+    def __init__(self, path: str = "outputs/cache.jsonl", threshold: float = 0.95):
+        """
+        Two-tier completion cache: exact request match first, then embedding
+        similarity on the final user turn of otherwise identical requests
+
+        :param path: JSONL file the cache entries are persisted to
+        :param threshold: Minimum cosine similarity for a semantic hit
+        """
+        self.path = path
+        self.threshold = threshold
+        self.exact: Dict[str, Dict[str, Any]] = {}
+        # Per-context similarity index: the entries sharing a context and a
+        # matrix of their normalized embeddings, one row per entry
+        self.entries: Dict[str, List[Dict[str, Any]]] = {}
+        self.embeddings: Dict[str, np.ndarray] = {}
+        self._load()
+
+    @staticmethod
+    def keys(request: Dict[str, Any]) -> Tuple[str, str]:
+        """
+        Compute both keys of a request from a single serialization: the request
+        key identifies it exactly (model, messages and sampling params), the
+        context key everything except the final user turn, so semantic matches
+        never cross techniques, examples or sampling params
+
+        :param request: Keyword arguments of the completion request
+        :return: (request key, context key)
+        """
+        context = json.dumps({**request, "messages": request["messages"][:-1]}, sort_keys=True)
+        digest = hashlib.sha256(context.encode("utf-8"))
+        context_key = digest.hexdigest()
+        digest.update(json.dumps(request["messages"][-1], sort_keys=True).encode("utf-8"))
+        return digest.hexdigest(), context_key
+
+    def get_exact(self, request: Dict[str, Any],
+                  keys: Optional[Tuple[str, str]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached response for an identical request
+
+        :param request: Keyword arguments of the completion request
+        :param keys: The request's ``keys``, if already computed
+        :return: Cached response dict, or None on a miss
+        """
+        key, _ = keys or self.keys(request)
+        entry = self.exact.get(key)
+        return entry["response"] if entry else None
+
+    def get_similar(self, request: Dict[str, Any], embedding: np.ndarray,
+                    keys: Optional[Tuple[str, str]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached response whose final user turn is semantically close
+
+        :param request: Keyword arguments of the completion request
+        :param embedding: Normalized embedding of the final user turn
+        :param keys: The request's ``keys``, if already computed
+        :return: Cached response dict, or None on a miss
+        """
+        _, context = keys or self.keys(request)
+        if context not in self.embeddings:
+            return None
+
+        similarities = self.embeddings[context] @ embedding
+        best = int(np.argmax(similarities))
+        if similarities[best] > self.threshold:
+            return self.entries[context][best]["response"]
+        return None
+
+    def add(self, request: Dict[str, Any], embedding: Optional[np.ndarray], response: Dict[str, Any],
+            keys: Optional[Tuple[str, str]] = None):
+        """
+        Store a response and append it to the cache file
+
+        :param request: Keyword arguments of the completion request
+        :param embedding: Normalized embedding of the final user turn, or None
+            to make the entry available to exact lookups only
+        :param response: Serialized completion response
+        :param keys: The request's ``keys``, if already computed
+        """
+        # Concurrent identical requests share one call but each stores its
+        # result; only the first copy is kept
+        key, context = keys or self.keys(request)
+        if key in self.exact:
+            return
+
+        entry = {
+            "key": key,
+            "context": context,
+            "embedding": embedding.tolist() if embedding is not None else None,
+            "response": response
+        }
+        self._insert(entry)
+
+        with open(self.path, 'a') as f:
+            f.write(json.dumps(entry) + "\n")
+
+    def _insert(self, entry: Dict[str, Any]):
+        self.exact[entry["key"]] = entry
+        if entry["embedding"] is None:
+            return
+
+        context = entry["context"]
+        vector = np.asarray(entry["embedding"], dtype=np.float32)[np.newaxis, :]
+        self.entries.setdefault(context, []).append(entry)
+        if context in self.embeddings:
+            self.embeddings[context] = np.vstack([self.embeddings[context], vector])
+        else:
+            self.embeddings[context] = vector
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+
+        with open(self.path) as f:
+            for line in f:
+                if not line.strip():
+                    continue
+
+                # A crash mid-append leaves a truncated last line; it is
+                # dropped rather than making the whole cache unreadable
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if entry["key"] not in self.exact:
+                    self._insert(entry)
+
 
 class PromptEngineeringPlayground:
-    def __init__(self, api_key: str = None):
+    # Technique names and the methods that run them, shared by every instance
+    _TECHNIQUE_METHODS = (
+        ("Zero-Shot Prompting", "zero_shot_prompting"),
+        ("Few-Shot Prompting", "few_shot_prompting"),
+        ("Chain-of-Thought Prompting", "chain_of_thought_prompting"),
+        ("Role-Playing Prompting", "role_playing_prompting"),
+        ("Persona-Based Prompting", "persona_based_prompting"),
+        ("ReAct Prompting", "react_prompting"),
+        ("Self-Consistency Prompting", "self_consistency_prompting"),
+        ("Tree-of-Thoughts Prompting", "tree_of_thoughts_prompting")
+    )
+    _TECHNIQUE_TO_ATTR = dict(_TECHNIQUE_METHODS)
+    TECHNIQUE_NAMES = tuple(name for name, _ in _TECHNIQUE_METHODS)
+    _TEMPLATES = _PROMPT_TEMPLATES
+
+    def __init__(self, api_key: str = None, use_cache: bool = True):
         """
         Initialize the Prompt Engineering Playground
 
         :param api_key: OpenAI API key for accessing GPT models
+        :param use_cache: Serve repeated or near-identical requests from the response cache
         """
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         if not self.api_key:
             raise ValueError("OpenAI API key must be provided")
 
-        self.client = OpenAI(api_key=self.api_key)
-        self.tokenizer = tiktoken.encoding_for_model("gpt-3.5-turbo")
-        
-        self.prompting_techniques = {
-            "Zero-Shot Prompting": self.zero_shot_prompting,
-            "Few-Shot Prompting": self.few_shot_prompting,
-            "Chain-of-Thought Prompting": self.chain_of_thought_prompting,
-            "Role-Playing Prompting": self.role_playing_prompting,
-            "Persona-Based Prompting": self.persona_based_prompting,
-            "ReAct Prompting": self.react_prompting,
-            "Self-Consistency Prompting": self.self_consistency_prompting,
-            "Tree-of-Thoughts Prompting": self.tree_of_thoughts_prompting
-        }
+        # Pooled HTTP/2 clients multiplex concurrent requests over a few
+        # long-lived connections instead of paying a handshake per request
+        # Idle connections are kept for 85s (httpx defaults to 5s) so they
+        # survive the pauses between interactive requests
+        limits = httpx.Limits(max_connections=100, max_keepalive_connections=50, keepalive_expiry=85.0)
+        timeout = httpx.Timeout(60.0, connect=10.0)
+        self._http = httpx.Client(http2=True, limits=limits, timeout=timeout)
+        self._ahttp = httpx.AsyncClient(http2=True, limits=limits, timeout=timeout)
+
+        self.client = OpenAI(api_key=self.api_key, http_client=self._http)
+        # Retries are handled by _retry_transient, not the client's own retry loop
+        self.aclient = AsyncOpenAI(api_key=self.api_key, max_retries=0, http_client=self._ahttp)
+        # Sync wrappers submit the async methods to one long-lived loop so the
+        # async client's connection pool is never shared across closed loops.
+        # The loop runs on its own thread, so the sync API also works from
+        # callers that already run a loop (Jupyter, async frameworks) and from
+        # several Streamlit sessions sharing one cached instance at once
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(target=self._loop.run_forever, name="prompt-playground-loop", daemon=True)
+        self._loop_thread.start()
+
+        # Bound parallel dispatch so concurrent fan-out stays under the account's rate limits
+        self._executor = ThrottledOpenAIExecutor(
+            self.aclient,
+            max_requests_per_minute=int(os.getenv("OPENAI_MAX_REQUESTS_PER_MINUTE", "3500")),
+            max_tokens_per_minute=int(os.getenv("OPENAI_MAX_TOKENS_PER_MINUTE", "90000")),
+            max_concurrency=int(os.getenv("OPENAI_MAX_CONCURRENCY", "10"))
+        )
+        self.tokenizer = _ENCODER
         
-        # Ensure output directory exists
-        os.makedirs("outputs", exist_ok=True)
+        self.cache = SemanticCache() if use_cache else None
+
+        # Every demonstration is appended to one JSONL log, opened on the first
+        # write; the handle is shared by concurrent runs, so writes are serialized
+        self._log_fp = None
+        self._log_lock = threading.Lock()
+
+    @property
+    def prompting_techniques(self) -> Dict[str, Any]:
+        """
+        Map each technique name to the bound method that runs it
+
+        :return: Dict of technique name to method
+        """
+        return {name: getattr(self, attr) for name, attr in self._TECHNIQUE_METHODS}
+
+    def close(self):
+        """
+        Close the pooled HTTP connections, the demonstration log and the playground's event loop
+        """
+        if self._log_fp is not None:
+            self._log_fp.close()
+        self._http.close()
+        self._run_sync(self._ahttp.aclose())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._loop_thread.join()
+        self._loop.close()
+
+    def _run_sync(self, coro):
+        """
+        Run a coroutine to completion on the playground's event loop and wait for it
+
+        :param coro: Coroutine to execute
+        :return: The coroutine's result
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    async def _acreate(self, **kwargs) -> ChatCompletion:
+        """
+        Create a chat completion, serving it from the response cache when possible
+
+        :param kwargs: Arguments for ``chat.completions.create``
+        :return: Chat completion response
+        """
+        # The messages are tokenized and the request serialized once; the
+        # count and keys are handed to every later step that needs them
+        prompt_tokens = self._check_prompt_size(kwargs["messages"])
+
+        # Multi-sample requests (self-consistency) exist to get fresh, diverse
+        # paths, so they are never served from or stored in the cache
+        if self.cache is None or kwargs.get("n", 1) > 1:
+            return await self._acall(prompt_tokens, **kwargs)
+
+        keys = self.cache.keys(kwargs)
+        cached = self.cache.get_exact(kwargs, keys)
+        if cached is not None:
+            return self._cached_completion(cached)
+
+        cached, embedding = await self._alookup_similar(kwargs, keys)
+        if cached is not None:
+            return self._cached_completion(cached)
+
+        response = await self._acall(prompt_tokens, request_key=keys[0], **kwargs)
+        self._cache_response(kwargs, keys, embedding, response)
+        return response
+
+    def _cache_response(self, request: Dict[str, Any], keys: Tuple[str, str],
+                        embedding: Optional[np.ndarray], response: ChatCompletion):
+        """
+        Store a paid-for response; a cache write failure (full disk, bad
+        permissions) must not throw the answer away, so it is ignored
+
+        :param request: Keyword arguments of the completion request
+        :param keys: The request's cache keys
+        :param embedding: Normalized embedding of the final user turn, or None
+        :param response: Chat completion response
+        """
+        try:
+            self.cache.add(request, embedding, response.model_dump(mode="json"), keys)
+        except Exception:
+            pass
+
+    @staticmethod
+    def _cached_completion(response: Dict[str, Any]) -> ChatCompletion:
+        """
+        Rebuild a cached response; it was served without an API call, so its
+        usage is zeroed and it reports no tokens or cost. It also carries an
+        extra ``cached`` field so results can say where the answer came from
+
+        :param response: Serialized completion response from the cache
+        :return: Chat completion response
+        """
+        return ChatCompletion.model_validate({
+            **response,
+            "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+            "cached": True
+        })
+
+    def _check_prompt_size(self, messages: List[Dict[str, str]]) -> int:
+        """
+        Fail fast locally rather than paying a round trip for the server to reject the prompt
+
+        :param messages: Chat messages about to be sent
+        :return: Token count of the messages
+        """
+        prompt_tokens = self._count_message_tokens(messages)
+        if prompt_tokens >= _MAX_PROMPT_TOKENS:
+            raise ValueError(f"Prompt is {prompt_tokens} tokens, exceeding the {_MAX_PROMPT_TOKENS} token limit")
+        return prompt_tokens
+
+    def _count_message_tokens(self, messages: List[Dict[str, str]]) -> int:
+        """
+        Count the prompt tokens of a chat message list
+
+        :param messages: Chat messages
+        :return: Token count including the per-message ChatML overhead and reply priming
+        """
+        return count_messages_tokens(messages)
+
+    async def _acall(self, prompt_tokens: int, request_key: Optional[str] = None, **kwargs) -> ChatCompletion:
+        """
+        Send a chat completion request through the rate-limited executor
+
+        :param prompt_tokens: Token count of the request's messages
+        :param request_key: Digest identifying the request exactly, if already computed
+        :param kwargs: Arguments for ``chat.completions.create``
+        :return: Chat completion response
+        """
+        return await self._executor.create(prompt_tokens, request_key=request_key, **kwargs)
+
+    async def _alookup_similar(self, request: Dict[str, Any],
+                               keys: Tuple[str, str]) -> Tuple[Optional[Dict[str, Any]], Optional[np.ndarray]]:
+        """
+        Look a request up in the semantic cache tier; the cache is only an
+        optimization, so any failure here is a miss rather than an error
+
+        :param request: Keyword arguments of the completion request
+        :param keys: The request's cache keys
+        :return: (cached response or None, embedding of the final user turn or
+            None when it could not be embedded)
+        """
+        text = request["messages"][-1]["content"]
+        # A token never spans less than one byte, so only a final turn longer
+        # than the limit in bytes needs to be tokenized again
+        if len(text.encode("utf-8")) > _MAX_EMBEDDING_TOKENS and count_tokens(text) > _MAX_EMBEDDING_TOKENS:
+            return None, None
+
+        try:
+            embedding = await self._aembed(text)
+        except Exception:
+            return None, None
+
+        try:
+            return self.cache.get_similar(request, embedding, keys), embedding
+        except Exception:
+            return None, embedding
+
+    async def _aembed(self, text: str) -> np.ndarray:
+        """
+        Embed text for semantic cache lookups
+
+        :param text: Text to embed
+        :return: Unit-normalized embedding vector
+        """
+        response = await self._executor.embed(model="text-embedding-3-small", input=text)
+        vector = np.asarray(response.data[0].embedding, dtype=np.float32)
+        return vector / np.linalg.norm(vector)
     
     def zero_shot_prompting(self, prompt: str) -> Dict[str, Any]:
         """
@@ -39,33 +851,14 @@ class PromptEngineeringPlayground:
         :param prompt: Input prompt
         :return: Dict with response, tokens, and cost
         """
-        try:
-            messages = [
-                {"role": "system", "content": "You are a helpful assistant."},
-                {"role": "user", "content": prompt}
-            ]
-
-            response = self.client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=messages
-            )
+        return self._run_sync(self.azero_shot_prompting(prompt))
 
-            result = response.choices[0].message.content
-            tokens_used = response.usage.total_tokens
-            cost = self.calculate_cost(tokens_used, "gpt-3.5-turbo")
+    async def azero_shot_prompting(self, prompt: str) -> Dict[str, Any]:
+        """
+        Async variant of ``zero_shot_prompting``
+        """
+        return await self._arun_technique("Zero-Shot Prompting", prompt=prompt)
 
-            return {
-                "response": result,
-                "tokens": tokens_used,
-                "cost": cost
-            }
-        except Exception as e:
-            return {
-                "response": f"Error in zero-shot prompting: {str(e)}",
-                "tokens": 0,
-                "cost": 0.0
-            }
-    
     def few_shot_prompting(self, prompt: str, examples: List[Dict[str, str]] = None) -> Dict[str, Any]:
         """
         Demonstrate few-shot prompting with a few examples
@@ -74,44 +867,46 @@ class PromptEngineeringPlayground:
         :param examples: List of example interactions
         :return: Dict with response, tokens, and cost
         """
-        if examples is None:
-            examples = [
-                {"input": "Translate to French: Hello", "output": "Bonjour"},
-                {"input": "Translate to French: Goodbye", "output": "Au revoir"}
-            ]
+        return self._run_sync(self.afew_shot_prompting(prompt, examples))
 
-        messages = [{"role": "system", "content": "You are a helpful translation assistant."}]
-
-        # Add few-shot examples
-        for example in examples:
-            messages.append({"role": "user", "content": example["input"]})
-            messages.append({"role": "assistant", "content": example["output"]})
+    async def afew_shot_prompting(self, prompt: str, examples: List[Dict[str, str]] = None) -> Dict[str, Any]:
+        """
+        Async variant of ``few_shot_prompting``
+        """
+        return await self._arun_technique("Few-Shot Prompting", prompt=prompt, examples=examples)
 
-        # Add current prompt
-        messages.append({"role": "user", "content": prompt})
+    def few_shot_batch(self, prompts: List[str], examples: List[Dict[str, str]] = None) -> List[Dict[str, Any]]:
+        """
+        Run few-shot prompting over many prompts that share the same examples
 
-        try:
-            response = self.client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=messages
-            )
+        :param prompts: Input prompts
+        :param examples: List of example interactions shared by every prompt
+        :return: List of dicts with response, tokens, and cost, in prompt order
+        """
+        return self._run_sync(self.afew_shot_batch(prompts, examples))
 
-            result = response.choices[0].message.content
-            tokens_used = response.usage.total_tokens
-            cost = self.calculate_cost(tokens_used, "gpt-3.5-turbo")
+    async def afew_shot_batch(self, prompts: List[str], examples: List[Dict[str, str]] = None) -> List[Dict[str, Any]]:
+        """
+        Async variant of ``few_shot_batch``
+        """
+        technique = "Few-Shot Prompting"
+        # The system message and examples form a prefix shared by every request,
+        # so it is built once and only the final user turn differs. It is sized
+        # against the longest prompt so examples are dropped if any prompt needs it
+        longest = max(prompts, key=count_tokens, default="")
+        base = self._technique_request(technique, prompt=longest, examples=examples)
+        prefix = base["messages"][:-1]
+
+        async def run(prompt: str) -> Dict[str, Any]:
+            response = await self._acreate(**{**base, "messages": prefix + [{"role": "user", "content": prompt}]})
+            return self._technique_result(technique, response)
+
+        results = await asyncio.gather(*(run(prompt) for prompt in prompts), return_exceptions=True)
+        return [
+            _error_result(result) if isinstance(result, Exception) else result
+            for result in results
+        ]
 
-            return {
-                "response": result,
-                "tokens": tokens_used,
-                "cost": cost
-            }
-        except Exception as e:
-            return {
-                "response": f"Error in few-shot prompting: {str(e)}",
-                "tokens": 0,
-                "cost": 0.0
-            }
-    
     def chain_of_thought_prompting(self, problem: str) -> Dict[str, Any]:
         """
         Demonstrate chain-of-thought prompting for complex reasoning
@@ -119,41 +914,14 @@ class PromptEngineeringPlayground:
         :param problem: Input problem requiring step-by-step reasoning
         :return: Dict with response, tokens, and cost
         """
-        prompt = f"""Let's solve this problem step by step:
-        {problem}
+        return self._run_sync(self.achain_of_thought_prompting(problem))
 
-        Break down your reasoning into clear, logical steps:
-        1. First, identify the key components of the problem.
-        2. Then, outline the approach to solve it.
-        3. Show the detailed calculation or reasoning.
-        4. Provide the final solution.
+    async def achain_of_thought_prompting(self, problem: str) -> Dict[str, Any]:
         """
+        Async variant of ``chain_of_thought_prompting``
+        """
+        return await self._arun_technique("Chain-of-Thought Prompting", problem=problem)
 
-        try:
-            response = self.client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {"role": "system", "content": "You are an expert problem solver who explains reasoning clearly."},
-                    {"role": "user", "content": prompt}
-                ]
-            )
-
-            result = response.choices[0].message.content
-            tokens_used = response.usage.total_tokens
-            cost = self.calculate_cost(tokens_used, "gpt-3.5-turbo")
-
-            return {
-                "response": result,
-                "tokens": tokens_used,
-                "cost": cost
-            }
-        except Exception as e:
-            return {
-                "response": f"Error in chain-of-thought prompting: {str(e)}",
-                "tokens": 0,
-                "cost": 0.0
-            }
-    
     def role_playing_prompting(self, role: str, task: str) -> Dict[str, Any]:
         """
         Demonstrate role-playing prompting by assigning a specific role
@@ -162,39 +930,14 @@ class PromptEngineeringPlayground:
         :param task: The task to be completed
         :return: Dict with response, tokens, and cost
         """
-        prompt = f"""
-        You are a {role}.
-        Task: {task}
+        return self._run_sync(self.arole_playing_prompting(role, task))
 
-        Please respond as if you were truly in this role, using appropriate language,
-        expertise, and perspective of the assigned persona.
+    async def arole_playing_prompting(self, role: str, task: str) -> Dict[str, Any]:
         """
+        Async variant of ``role_playing_prompting``
+        """
+        return await self._arun_technique("Role-Playing Prompting", role=role, task=task)
 
-        try:
-            response = self.client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {"role": "system", "content": f"You are a {role}."},
-                    {"role": "user", "content": prompt}
-                ]
-            )
-
-            result = response.choices[0].message.content
-            tokens_used = response.usage.total_tokens
-            cost = self.calculate_cost(tokens_used, "gpt-3.5-turbo")
-
-            return {
-                "response": result,
-                "tokens": tokens_used,
-                "cost": cost
-            }
-        except Exception as e:
-            return {
-                "response": f"Error in role-playing prompting: {str(e)}",
-                "tokens": 0,
-                "cost": 0.0
-            }
-    
     def persona_based_prompting(self, persona: str, query: str) -> Dict[str, Any]:
         """
         Demonstrate persona-based prompting with specific characteristics
@@ -203,40 +946,13 @@ class PromptEngineeringPlayground:
         :param query: User's query
         :return: Dict with response, tokens, and cost
         """
-        prompt = f"""
-        You are a {persona}.
-        Consider your unique background, knowledge, and communication style.
-
-        Respond to the following query:
-        {query}
+        return self._run_sync(self.apersona_based_prompting(persona, query))
 
-        Ensure your response reflects the specific perspective of this persona.
+    async def apersona_based_prompting(self, persona: str, query: str) -> Dict[str, Any]:
         """
-
-        try:
-            response = self.client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {"role": "system", "content": f"You are a {persona}"},
-                    {"role": "user", "content": prompt}
-                ]
-            )
-
-            result = response.choices[0].message.content
-            tokens_used = response.usage.total_tokens
-            cost = self.calculate_cost(tokens_used, "gpt-3.5-turbo")
-
-            return {
-                "response": result,
-                "tokens": tokens_used,
-                "cost": cost
-            }
-        except Exception as e:
-            return {
-                "response": f"Error in persona-based prompting: {str(e)}",
-                "tokens": 0,
-                "cost": 0.0
-            }
+        Async variant of ``persona_based_prompting``
+        """
+        return await self._arun_technique("Persona-Based Prompting", persona=persona, query=query)
 
     def react_prompting(self, task: str) -> Dict[str, Any]:
         """
@@ -245,43 +961,13 @@ class PromptEngineeringPlayground:
         :param task: Task requiring reasoning and actions
         :return: Dict with response, tokens, and cost
         """
-        prompt = f"""
-        Task: {task}
-
-        Use the ReAct framework to solve this task:
-        1. Thought: What do I need to think about?
-        2. Action: What action should I take?
-        3. Observation: What did I observe?
-        4. (Repeat as needed)
-        5. Answer: Final solution
+        return self._run_sync(self.areact_prompting(task))
 
-        Format your response with clear Thought, Action, and Observation steps.
+    async def areact_prompting(self, task: str) -> Dict[str, Any]:
         """
-
-        try:
-            response = self.client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {"role": "system", "content": "You are an AI assistant that uses the ReAct framework (Reasoning + Acting) to solve problems step by step."},
-                    {"role": "user", "content": prompt}
-                ]
-            )
-
-            result = response.choices[0].message.content
-            tokens_used = response.usage.total_tokens
-            cost = self.calculate_cost(tokens_used, "gpt-3.5-turbo")
-
-            return {
-                "response": result,
-                "tokens": tokens_used,
-                "cost": cost
-            }
-        except Exception as e:
-            return {
-                "response": f"Error in ReAct prompting: {str(e)}",
-                "tokens": 0,
-                "cost": 0.0
-            }
+        Async variant of ``react_prompting``
+        """
+        return await self._arun_technique("ReAct Prompting", task=task)
 
     def self_consistency_prompting(self, problem: str, num_samples: int = 3) -> Dict[str, Any]:
         """
@@ -291,124 +977,254 @@ class PromptEngineeringPlayground:
         :param num_samples: Number of reasoning paths to generate
         :return: Dict with multiple responses and aggregated result
         """
-        prompt = f"""
-        Solve this problem and explain your reasoning:
-        {problem}
+        return self._run_sync(self.aself_consistency_prompting(problem, num_samples))
 
-        Show your step-by-step thinking process.
+    async def aself_consistency_prompting(self, problem: str, num_samples: int = 3) -> Dict[str, Any]:
+        """
+        Async variant of ``self_consistency_prompting``
         """
+        return await self._arun_technique("Self-Consistency Prompting", problem=problem, num_samples=num_samples)
 
-        try:
-            responses = []
-            total_tokens = 0
-
-            for i in range(num_samples):
-                response = self.client.chat.completions.create(
-                    model="gpt-3.5-turbo",
-                    messages=[
-                        {"role": "system", "content": "You are an expert problem solver. Think step by step and show your reasoning."},
-                        {"role": "user", "content": prompt}
-                    ],
-                    temperature=0.7  # Higher temperature for diversity
-                )
-
-                responses.append(response.choices[0].message.content)
-                total_tokens += response.usage.total_tokens
+    def tree_of_thoughts_prompting(self, problem: str) -> Dict[str, Any]:
+        """
+        Demonstrate Tree-of-Thoughts prompting by exploring multiple solution branches
 
-            # Aggregate responses
-            aggregated = f"Self-Consistency Analysis ({num_samples} reasoning paths):\n\n"
-            for i, resp in enumerate(responses, 1):
-                aggregated += f"--- Path {i} ---\n{resp}\n\n"
+        :param problem: Complex problem to solve
+        :return: Dict with response, tokens, and cost
+        """
+        return self._run_sync(self.atree_of_thoughts_prompting(problem))
 
-            aggregated += "\n--- Consensus ---\nMultiple reasoning paths generated. Review the different approaches above."
+    async def atree_of_thoughts_prompting(self, problem: str) -> Dict[str, Any]:
+        """
+        Async variant of ``tree_of_thoughts_prompting``
+        """
+        return await self._arun_technique("Tree-of-Thoughts Prompting", problem=problem)
 
-            cost = self.calculate_cost(total_tokens, "gpt-3.5-turbo")
+    def _technique_request(self, technique: str, **params) -> Dict[str, Any]:
+        """
+        Build the chat completion request for a technique without sending it
 
-            return {
-                "response": aggregated,
-                "tokens": total_tokens,
-                "cost": cost,
-                "num_paths": num_samples
-            }
-        except Exception as e:
-            return {
-                "response": f"Error in self-consistency prompting: {str(e)}",
-                "tokens": 0,
-                "cost": 0.0
-            }
+        :param technique: Technique name
+        :param params: The technique's parameters
+        :return: Keyword arguments for ``chat.completions.create``
+        """
+        request = {"model": "gpt-3.5-turbo"}
 
-    def tree_of_thoughts_prompting(self, problem: str) -> Dict[str, Any]:
+        if technique in _TECHNIQUE_CONFIG:
+            system_prompt, user_prompt = _TECHNIQUE_CONFIG[technique]
+            system_message = _SYSTEM_MESSAGES.get(technique)
+            if system_message is None:
+                system_message = {"role": "system", "content": _fill_template(system_prompt, params)}
+            messages = [
+                system_message,
+                {"role": "user", "content": _fill_template(user_prompt, params)}
+            ]
+
+        elif technique == "Few-Shot Prompting":
+            examples = params.get("examples")
+            if examples is None:
+                examples = _DEFAULT_FEW_SHOT_EXAMPLES
+
+            system_message = _SYS_TRANSLATOR
+            prompt_message = {"role": "user", "content": params["prompt"]}
+            example_messages = [
+                [
+                    {"role": "user", "content": example["input"]},
+                    {"role": "assistant", "content": example["output"]}
+                ]
+                for example in examples
+            ]
+
+            # Drop the oldest examples until the prompt fits the context window
+            example_tokens = [self._count_message_tokens(pair) for pair in example_messages]
+            total_tokens = self._count_message_tokens([system_message, prompt_message]) + sum(example_tokens)
+            dropped = 0
+            while dropped < len(example_messages) and total_tokens >= _MAX_PROMPT_TOKENS:
+                total_tokens -= example_tokens[dropped]
+                dropped += 1
+
+            messages = [system_message]
+
+            # Add few-shot examples
+            for pair in example_messages[dropped:]:
+                messages.extend(pair)
+
+            # Add current prompt
+            messages.append(prompt_message)
+
+        elif technique == "Self-Consistency Prompting":
+            messages = [
+                _SYS_SELF_CONSISTENCY,
+                {"role": "user", "content": params["problem"]}
+            ]
+            # Sample every reasoning path in a single request; the prompt is
+            # sent and billed once, only completion tokens scale with n
+            request["temperature"] = 0.7  # Higher temperature for diversity
+            request["n"] = params.get("num_samples", 3)
+
+        else:
+            raise ValueError(f"Technique {technique} not found")
+
+        request["messages"] = messages
+        return request
+
+    async def _arun_technique(self, technique: str, **params) -> Dict[str, Any]:
         """
-        Demonstrate Tree-of-Thoughts prompting by exploring multiple solution branches
+        Build, send and wrap the request for any technique
 
-        :param problem: Complex problem to solve
+        :param technique: Technique name
+        :param params: The technique's parameters
         :return: Dict with response, tokens, and cost
         """
-        prompt = f"""
-        Problem: {problem}
+        response = await self._acreate(**self._technique_request(technique, **params))
+        return self._technique_result(technique, response)
 
-        Use Tree-of-Thoughts approach:
-        1. Generate 3 initial solution approaches
-        2. For each approach, evaluate its strengths and weaknesses
-        3. Select the most promising approach
-        4. Develop that approach with detailed steps
-        5. Provide the final solution
-
-        Format your response clearly showing:
-        - Initial Branches (3 approaches)
-        - Evaluation of each branch
-        - Selected branch with reasoning
-        - Detailed solution
+    def stream_technique(self, technique: str, result: Optional[Dict[str, Any]] = None,
+                         **params) -> Iterator[str]:
         """
+        Stream a technique's response as it is generated
 
+        :param technique: Technique name
+        :param result: Optional dict that is filled with the response, tokens and
+            cost once the stream has finished
+        :param params: The technique's parameters
+        :return: Iterator over response text fragments
+        """
+        fragments = self.astream_technique(technique, result=result, **params)
         try:
-            response = self.client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {"role": "system", "content": "You are an expert at exploring multiple solution paths and selecting the best approach."},
-                    {"role": "user", "content": prompt}
-                ]
-            )
+            while True:
+                try:
+                    yield self._run_sync(fragments.__anext__())
+                except StopAsyncIteration:
+                    return
+        finally:
+            # Releases the connection if the caller stops reading early
+            self._run_sync(fragments.aclose())
+
+    async def astream_technique(self, technique: str, result: Optional[Dict[str, Any]] = None,
+                                **params) -> AsyncIterator[str]:
+        """
+        Async variant of ``stream_technique``
+        """
+        if technique == "Self-Consistency Prompting":
+            raise ValueError("Self-Consistency Prompting samples several completions and cannot be streamed")
+
+        request = self._technique_request(technique, **params)
+        prompt_tokens = self._check_prompt_size(request["messages"])
+
+        # A request answered before is replayed in one piece without touching the API
+        embedding = None
+        if self.cache is not None:
+            keys = self.cache.keys(request)
+            cached = self.cache.get_exact(request, keys)
+            if cached is None:
+                cached, embedding = await self._alookup_similar(request, keys)
+            if cached is not None:
+                completion = self._cached_completion(cached)
+                yield completion.choices[0].message.content
+                if result is not None:
+                    result.update(self._technique_result(technique, completion))
+                return
+
+        fragments = []
+        finish_reason = "stop"
+        last = None
+        async for chunk in self._executor.stream(prompt_tokens, **request):
+            last = chunk
+            if chunk.choices:
+                fragments.append(chunk.choices[0].delta.content or "")
+                yield fragments[-1]
+                if chunk.choices[0].finish_reason:
+                    finish_reason = chunk.choices[0].finish_reason
+
+        # Only reached when the stream was read to the end; the assembled
+        # completion is cached like any other response
+        if last is None:
+            # The stream ended without a single chunk, so there is nothing to cache
+            if result is not None:
+                result.update({"response": "", "tokens": 0, "cost": 0.0})
+            return
+
+        text = "".join(fragments)
+        if last.usage is not None:
+            usage = last.usage.model_dump()
+        else:
+            completion_tokens = count_tokens(text)
+            usage = {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens
+            }
 
-            result = response.choices[0].message.content
-            tokens_used = response.usage.total_tokens
-            cost = self.calculate_cost(tokens_used, "gpt-3.5-turbo")
+        completion = ChatCompletion.model_validate({
+            "id": last.id,
+            "object": "chat.completion",
+            "created": last.created,
+            "model": last.model,
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": text},
+                "finish_reason": finish_reason
+            }],
+            "usage": usage
+        })
+        if self.cache is not None:
+            self._cache_response(request, keys, embedding, completion)
+        if result is not None:
+            result.update(self._technique_result(technique, completion))
+
+    def _technique_result(self, technique: str, response: ChatCompletion, batch: bool = False) -> Dict[str, Any]:
+        """
+        Convert a chat completion into the technique's result dict
 
-            return {
-                "response": result,
+        :param technique: Technique name
+        :param response: Chat completion returned for the technique's request
+        :param batch: The completion came from the Batch API and is priced at its discount
+        :return: Dict with response, tokens, and cost, plus ``cached`` for cache hits
+        """
+        tokens_used = response.usage.total_tokens
+        cost = self.calculate_cost(tokens_used, "gpt-3.5-turbo", batch=batch)
+
+        if technique == "Self-Consistency Prompting":
+            responses = [choice.message.content for choice in response.choices]
+
+            # Aggregate responses
+            aggregated = f"Self-Consistency Analysis ({len(responses)} reasoning paths):\n\n"
+            for i, resp in enumerate(responses, 1):
+                aggregated += f"--- Path {i} ---\n{resp}\n\n"
+
+            aggregated += "\n--- Consensus ---\nMultiple reasoning paths generated. Review the different approaches above."
+
+            result = {
+                "response": aggregated,
                 "tokens": tokens_used,
-                "cost": cost
+                "cost": cost,
+                "num_paths": len(responses)
             }
-        except Exception as e:
-            return {
-                "response": f"Error in Tree-of-Thoughts prompting: {str(e)}",
-                "tokens": 0,
-                "cost": 0.0
+        else:
+            result = {
+                "response": response.choices[0].message.content,
+                "tokens": tokens_used,
+                "cost": cost
             }
 
-    def calculate_cost(self, tokens: int, model: str = "gpt-3.5-turbo") -> float:
+        if getattr(response, "cached", False):
+            result["cached"] = True
+        return result
+
+    def calculate_cost(self, tokens: int, model: str = "gpt-3.5-turbo", batch: bool = False) -> float:
         """
         Calculate the cost of API usage
 
         :param tokens: Total tokens used
         :param model: Model name
+        :param batch: Price at the Batch API's discounted rate
         :return: Cost in USD
         """
-        # Pricing as of 2024 (per 1M tokens)
-        pricing = {
-            "gpt-3.5-turbo": {"input": 0.50, "output": 1.50},  # Average
-            "gpt-4": {"input": 30.00, "output": 60.00},
-            "gpt-4-turbo": {"input": 10.00, "output": 30.00}
-        }
-
-        # Use average pricing for simplicity (actual cost varies by input/output ratio)
-        if model in pricing:
-            avg_price = (pricing[model]["input"] + pricing[model]["output"]) / 2
-            cost = (tokens / 1_000_000) * avg_price
-        else:
-            cost = (tokens / 1_000_000) * 1.00  # Default fallback
-
-        return round(cost, 6)
+        price = _AVG_PRICE_PER_TOKEN.get(model, _DEFAULT_PRICE_PER_TOKEN)
+        if batch:
+            price *= _BATCH_DISCOUNT
+        return round(tokens * price, 6)
 
     def compare_techniques(self, prompt: str, techniques: List[str] = None) -> Dict[str, Any]:
         """
@@ -418,38 +1234,31 @@ class PromptEngineeringPlayground:
         :param techniques: List of technique names to compare
         :return: Dict with comparison results
         """
+        return self._run_sync(self.acompare_techniques(prompt, techniques))
+
+    async def acompare_techniques(self, prompt: str, techniques: List[str] = None) -> Dict[str, Any]:
+        """
+        Async variant of ``compare_techniques``; every technique is dispatched concurrently
+        """
         if techniques is None:
-            techniques = ["Zero-Shot Prompting", "Few-Shot Prompting", "Chain-of-Thought Prompting"]
+            techniques = list(_DEFAULT_COMPARE_TECHNIQUES)
+
+        outcomes = dict(await asyncio.gather(
+            *(self._acompare_entry(technique, prompt) for technique in techniques)
+        ))
 
         comparison_results = {}
         total_tokens = 0
         total_cost = 0.0
 
         for technique in techniques:
-            if technique not in self.prompting_techniques:
-                comparison_results[technique] = {"error": "Technique not found"}
+            result = outcomes[technique]
+            comparison_results[technique] = result
+            if "error" in result:
                 continue
 
-            try:
-                if technique == "Zero-Shot Prompting":
-                    result = self.zero_shot_prompting(prompt)
-                elif technique == "Few-Shot Prompting":
-                    result = self.few_shot_prompting(f"Translate to French: {prompt}")
-                elif technique == "Chain-of-Thought Prompting":
-                    result = self.chain_of_thought_prompting(prompt)
-                elif technique == "Role-Playing Prompting":
-                    result = self.role_playing_prompting("expert consultant", prompt)
-                elif technique == "Persona-Based Prompting":
-                    result = self.persona_based_prompting("experienced professional", prompt)
-                else:
-                    result = {"response": "Not implemented for comparison", "tokens": 0, "cost": 0.0}
-
-                comparison_results[technique] = result
-                total_tokens += result.get("tokens", 0)
-                total_cost += result.get("cost", 0.0)
-
-            except Exception as e:
-                comparison_results[technique] = {"error": str(e)}
+            total_tokens += result.get("tokens", 0)
+            total_cost += result.get("cost", 0.0)
 
         return {
             "prompt": prompt,
@@ -459,45 +1268,90 @@ class PromptEngineeringPlayground:
             "total_cost": round(total_cost, 6)
         }
 
-    def get_prompt_templates(self) -> Dict[str, Dict[str, str]]:
+    def iter_compare_techniques(self, prompt: str,
+                                techniques: List[str] = None) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Compare techniques concurrently, yielding each result as soon as it is ready
+
+        :param prompt: The same prompt to test across techniques
+        :param techniques: List of technique names to compare
+        :return: Iterator over (technique, result) pairs in completion order
+        """
+        results = self.aiter_compare_techniques(prompt, techniques)
+        try:
+            while True:
+                try:
+                    yield self._run_sync(results.__anext__())
+                except StopAsyncIteration:
+                    return
+        finally:
+            # Cancels whatever is still running if the caller stops early
+            self._run_sync(results.aclose())
+
+    async def aiter_compare_techniques(self, prompt: str,
+                                       techniques: List[str] = None) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Async variant of ``iter_compare_techniques``
+        """
+        if techniques is None:
+            techniques = list(_DEFAULT_COMPARE_TECHNIQUES)
+
+        tasks = [asyncio.ensure_future(self._acompare_entry(technique, prompt)) for technique in techniques]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _acompare_entry(self, technique: str, prompt: str) -> Tuple[str, Dict[str, Any]]:
+        """
+        Run one technique of a comparison, turning any failure into an error result
+
+        :param technique: Technique name
+        :param prompt: The prompt being compared
+        :return: (technique, result) pair
+        """
+        if technique not in self._TECHNIQUE_TO_ATTR:
+            return technique, _error_result(ValueError("Technique not found"))
+
+        try:
+            return technique, await self._acompare_one(technique, prompt)
+        except Exception as e:
+            return technique, _error_result(e)
+
+    async def _acompare_one(self, technique: str, prompt: str) -> Dict[str, Any]:
+        """
+        Run a single technique on the shared comparison prompt
+
+        :param technique: Technique name
+        :param prompt: The prompt being compared
+        :return: Technique result dict
+        """
+        if technique == "Zero-Shot Prompting":
+            return await self.azero_shot_prompting(prompt)
+        elif technique == "Few-Shot Prompting":
+            return await self.afew_shot_prompting(f"Translate to French: {prompt}")
+        elif technique == "Chain-of-Thought Prompting":
+            return await self.achain_of_thought_prompting(prompt)
+        elif technique == "Role-Playing Prompting":
+            return await self.arole_playing_prompting("expert consultant", prompt)
+        elif technique == "Persona-Based Prompting":
+            return await self.apersona_based_prompting("experienced professional", prompt)
+        elif technique == "ReAct Prompting":
+            return await self.areact_prompting(prompt)
+        elif technique == "Self-Consistency Prompting":
+            return await self.aself_consistency_prompting(prompt)
+        return await self.atree_of_thoughts_prompting(prompt)
+
+    @classmethod
+    def get_prompt_templates(cls) -> Mapping[str, Mapping[str, str]]:
         """
         Get a library of pre-built prompt templates
 
-        :return: Dict of prompt templates by category
+        :return: Read-only mapping of prompt templates by category
         """
-        return {
-            "Translation": {
-                "Simple": "Translate the following text to {language}: {text}",
-                "Formal": "Provide a formal translation of this text to {language}, maintaining professional tone: {text}",
-                "Context": "Translate this {context} text to {language}: {text}"
-            },
-            "Summarization": {
-                "Brief": "Summarize this in 2-3 sentences: {text}",
-                "Bullet Points": "Summarize the key points as a bullet list: {text}",
-                "Executive": "Provide an executive summary highlighting main insights: {text}"
-            },
-            "Code": {
-                "Explain": "Explain what this code does in simple terms: {code}",
-                "Debug": "Find and explain the bug in this code: {code}",
-                "Optimize": "Suggest optimizations for this code: {code}",
-                "Convert": "Convert this code from {from_lang} to {to_lang}: {code}"
-            },
-            "Creative Writing": {
-                "Story": "Write a {length} story about {topic} in the style of {style}",
-                "Poem": "Write a {type} poem about {topic}",
-                "Dialogue": "Write a dialogue between {character1} and {character2} about {topic}"
-            },
-            "Analysis": {
-                "Pros and Cons": "Analyze the pros and cons of {topic}",
-                "Compare": "Compare and contrast {item1} and {item2}",
-                "SWOT": "Perform a SWOT analysis of {topic}"
-            },
-            "Business": {
-                "Email": "Write a {tone} email about {topic} to {recipient}",
-                "Proposal": "Draft a business proposal for {project}",
-                "Report": "Create an executive report on {topic}"
-            }
-        }
+        return cls._TEMPLATES
 
     def use_template(self, category: str, template_name: str, **kwargs) -> str:
         """
@@ -508,106 +1362,255 @@ class PromptEngineeringPlayground:
         :param kwargs: Variables to fill in template
         :return: Formatted prompt
         """
-        templates = self.get_prompt_templates()
-
-        if category not in templates:
+        if category not in self._TEMPLATES:
             return f"Category '{category}' not found"
 
-        if template_name not in templates[category]:
+        if template_name not in self._TEMPLATES[category]:
             return f"Template '{template_name}' not found in category '{category}'"
 
-        template = templates[category][template_name]
+        template = self._TEMPLATES[category][template_name]
 
         try:
             return template.format(**kwargs)
         except KeyError as e:
             return f"Missing variable: {str(e)}"
 
-    def run_demonstration(self, technique: str, **kwargs) -> Dict[str, Any]:
+    def run_demonstration(self, technique: str, pretty: bool = False, **kwargs) -> DemoResult:
         """
         Run a demonstration of a specific prompting technique
         
         :param technique: Name of the prompting technique
+        :param pretty: Also write an indented per-technique JSON file for human reading
         :param kwargs: Parameters for the specific technique
-        :return: Dictionary with technique details and result
+        :return: Demonstration result
         """
-        if technique not in self.prompting_techniques:
-            return {"error": f"Technique {technique} not found"}
-        
-        result = self.prompting_techniques[technique](**kwargs)
-        
-        # Save the demonstration
-        demo_data = {
-            "technique": technique,
-            "input": kwargs,
-            "output": result
-        }
+        return self._run_sync(self.arun_demonstration(technique, pretty=pretty, **kwargs))
+
+    async def arun_demonstration(self, technique: str, pretty: bool = False, **kwargs) -> DemoResult:
+        """
+        Async variant of ``run_demonstration``
+        """
+        if technique not in self._TECHNIQUE_TO_ATTR:
+            return DemoResult.from_output(technique, kwargs, _error_result(ValueError(f"Technique {technique} not found")))
         
-        # Save to a JSON file
-        filename = f"outputs/{technique.lower().replace(' ', '_')}_demo.json"
-        with open(filename, 'w') as f:
-            json.dump(demo_data, f, indent=2)
+        try:
+            result = await self._arun_technique(technique, **kwargs)
+        except Exception as e:
+            result = _error_result(e)
         
-        return demo_data
+        demo = DemoResult.from_output(technique, kwargs, result)
+        self._log_demo(demo, pretty=pretty)
+        return demo
+
+    def _log_demo(self, demo: DemoResult, pretty: bool = False):
+        """
+        Append a demonstration to the JSONL log
+
+        :param demo: Demonstration result to save
+        :param pretty: Also write an indented per-technique JSON file for human reading
+        """
+        demo_data = demo.to_dict()
+
+        with self._log_lock:
+            if self._log_fp is None:
+                self._log_fp = open("outputs/demos.jsonl", "ab")
+            self._log_fp.write(orjson.dumps(demo_data) + b"\n")
+            self._log_fp.flush()
+
+        # Human-facing export of the latest run of this technique
+        if pretty:
+            filename = f"outputs/{demo.technique.lower().replace(' ', '_')}_demo.json"
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(demo_data, option=orjson.OPT_INDENT_2))
+
+    def run_demonstrations(self, demos: List[Dict[str, Any]], pretty: bool = False) -> List[DemoResult]:
+        """
+        Run several demonstrations concurrently
+
+        :param demos: List of {"technique": ..., "params": {...}} demonstrations
+        :param pretty: Also write an indented per-technique JSON file for human reading
+        :return: List of demonstration results, in the order given
+        """
+        return self._run_sync(self.arun_demonstrations(demos, pretty=pretty))
+
+    async def arun_demonstrations(self, demos: List[Dict[str, Any]], pretty: bool = False) -> List[DemoResult]:
+        """
+        Async variant of ``run_demonstrations``
+        """
+        return await asyncio.gather(*(
+            self.arun_demonstration(demo["technique"], pretty=pretty, **demo["params"])
+            for demo in demos
+        ))
+
+    def submit_batch_demonstrations(self, demos: List[Dict[str, Any]]) -> str:
+        """
+        Submit demonstrations as one OpenAI Batch API job (50% cheaper, results within 24h)
+
+        :param demos: List of {"technique": ..., "params": {...}} demonstrations
+        :return: ID of the created batch
+        """
+        lines = []
+        for i, demo in enumerate(demos):
+            technique = demo["technique"]
+            lines.append(orjson.dumps({
+                "custom_id": f"{i}_{technique.lower().replace(' ', '_')}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": self._technique_request(technique, **demo["params"])
+            }))
+
+        # The upload is built in memory; nothing needs to touch the disk
+        batch_input = io.BytesIO(b"\n".join(lines) + b"\n")
+        batch_file = self.client.files.create(file=("batch_input.jsonl", batch_input), purpose="batch")
+
+        batch = self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        return batch.id
+
+    def wait_for_batch(self, batch_id: str, initial_interval: float = 5.0,
+                       max_interval: float = 300.0) -> List[Dict[str, Any]]:
+        """
+        Poll a batch until it finishes and collect its results
+
+        :param batch_id: ID returned by ``submit_batch_demonstrations``
+        :param initial_interval: Seconds before the first status re-check
+        :param max_interval: Upper bound for the doubling poll interval
+        :return: List of {"custom_id": ..., "technique": ..., "output": ...} in submission order
+        """
+        # Small batches often finish in minutes, large ones take hours, so the
+        # poll interval starts short and backs off exponentially
+        interval = initial_interval
+        batch = self.client.batches.retrieve(batch_id)
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            time.sleep(interval)
+            interval = min(interval * 2, max_interval)
+            batch = self.client.batches.retrieve(batch_id)
+
+        if batch.status != "completed":
+            raise RuntimeError(f"Batch {batch_id} ended with status '{batch.status}'")
+
+        techniques = {name.lower().replace(' ', '_'): name for name in self.TECHNIQUE_NAMES}
+        # Successful requests land in the output file, failed ones in the error file
+        lines = []
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if file_id:
+                lines.extend(self.client.files.content(file_id).text.splitlines())
+
+        results = []
+        for line in lines:
+            if not line.strip():
+                continue
+
+            record = json.loads(line)
+            index, slug = record["custom_id"].split("_", 1)
+            technique = techniques[slug]
+
+            if record.get("error") or record["response"]["status_code"] != 200:
+                error = record.get("error") or record["response"]["body"].get("error", {})
+                output = {
+                    "error": error.get("message", str(error)),
+                    "error_type": error.get("code") or error.get("type") or "BatchRequestError",
+                    "tokens": 0,
+                    "cost": 0.0
+                }
+            else:
+                completion = ChatCompletion.model_validate(record["response"]["body"])
+                output = self._technique_result(technique, completion, batch=True)
+
+            results.append((int(index), {"custom_id": record["custom_id"], "technique": technique, "output": output}))
+
+        return [result for _, result in sorted(results, key=lambda item: item[0])]
+
+    def run_demonstrations_batch(self, demos: List[Dict[str, Any]], pretty: bool = False) -> List[DemoResult]:
+        """
+        Run demonstrations through the Batch API and wait for the results;
+        use ``run_demonstrations`` instead when latency matters
+
+        :param demos: List of {"technique": ..., "params": {...}} demonstrations
+        :param pretty: Also write an indented per-technique JSON file for human reading
+        :return: List of demonstration results, in the order given
+        """
+        results = self.wait_for_batch(self.submit_batch_demonstrations(demos))
+        demo_results = [
+            DemoResult.from_output(
+                result["technique"],
+                demos[int(result["custom_id"].split("_", 1)[0])]["params"],
+                result["output"]
+            )
+            for result in results
+        ]
+
+        # Saved like live runs, so batch results are on disk too
+        for demo in demo_results:
+            self._log_demo(demo, pretty=pretty)
+        return demo_results
 
 def main():
     """
     Main function to demonstrate the Prompt Engineering Playground
     """
+    parser = argparse.ArgumentParser(description="Run the prompt engineering demonstrations")
+    parser.add_argument("--batch", action="store_true",
+                        help="Submit the demonstrations through the OpenAI Batch API (half price, up to 24h turnaround)")
+    args = parser.parse_args()
+
     # Replace with your actual OpenAI API key or use environment variable
     api_key = os.getenv("OPENAI_API_KEY", "your-api-key-here")
     
     playground = PromptEngineeringPlayground(api_key)
-    
-    # Demonstrations of different prompting techniques
-    demonstrations = [
-        {
-            "technique": "Zero-Shot Prompting",
-            "params": {"prompt": "Explain quantum computing to a 5-year-old"}
-        },
-        {
-            "technique": "Few-Shot Prompting",
-            "params": {
-                "prompt": "Translate to German:", 
-                "examples": [
-                    {"input": "Hello, how are you?", "output": "Hallo, wie geht es dir?"}
-                ]
-            }
-        },
-        {
-            "technique": "Chain-of-Thought Prompting",
-            "params": {"problem": "A train travels 120 miles in 2 hours. What is its speed?"}
-        },
-        {
-            "technique": "Role-Playing Prompting",
-            "params": {
-                "role": "Shakespearean poet", 
-                "task": "Write a sonnet about modern technology"
-            }
-        },
-        {
-            "technique": "Persona-Based Prompting",
-            "params": {
-                "persona": "A curious 10-year-old science enthusiast", 
-                "query": "Explain how rockets work in space"
+    try:
+        # Demonstrations of different prompting techniques
+        demonstrations = [
+            {
+                "technique": "Zero-Shot Prompting",
+                "params": {"prompt": "Explain quantum computing to a 5-year-old"}
+            },
+            {
+                "technique": "Few-Shot Prompting",
+                "params": {
+                    "prompt": "Translate to German:", 
+                    "examples": [
+                        {"input": "Hello, how are you?", "output": "Hallo, wie geht es dir?"}
+                    ]
+                }
+            },
+            {
+                "technique": "Chain-of-Thought Prompting",
+                "params": {"problem": "A train travels 120 miles in 2 hours. What is its speed?"}
+            },
+            {
+                "technique": "Role-Playing Prompting",
+                "params": {
+                    "role": "Shakespearean poet", 
+                    "task": "Write a sonnet about modern technology"
+                }
+            },
+            {
+                "technique": "Persona-Based Prompting",
+                "params": {
+                    "persona": "A curious 10-year-old science enthusiast", 
+                    "query": "Explain how rockets work in space"
+                }
             }
-        }
-    ]
-    
-    # Run and store demonstrations
-    results = []
-    for demo in demonstrations:
-        result = playground.run_demonstration(
-            demo["technique"], 
-            **demo["params"]
-        )
-        results.append(result)
-    
-    # Print results
-    for result in results:
-        print(f"Technique: {result.get('technique', 'N/A')}")
-        print("Output:", result.get('output', 'No output'))
-        print("---")
+        ]
+
+        if args.batch:
+            print("Submitting batch and waiting for results...")
+            results = playground.run_demonstrations_batch(demonstrations)
+        else:
+            # Run and store demonstrations concurrently
+            results = playground.run_demonstrations(demonstrations)
+
+        # Print results
+        for result in results:
+            print(f"Technique: {result.technique}")
+            print("Output:", result.to_dict()["output"])
+            print("---")
+    finally:
+        playground.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,7 +1,44 @@
 import streamlit as st
 import os
+import re
+from functools import lru_cache
+from typing import Tuple
 from src.prompt_playground import PromptEngineeringPlayground
 
+_TEMPLATE_VAR_RE = re.compile(r'\{(\w+)\}')
+
+
+@st.cache_resource(show_spinner=False)
+def get_playground(api_key: str, use_cache: bool = True) -> PromptEngineeringPlayground:
+    """
+    Build one playground per API key and cache setting and reuse it across
+    reruns, so its clients, connection pools and caches outlive each widget
+    interaction
+    """
+    return PromptEngineeringPlayground(api_key, use_cache=use_cache)
+
+
+@lru_cache(maxsize=256)
+def template_variables(template: str) -> Tuple[str, ...]:
+    """
+    Extract the ``{placeholder}`` names of a template; templates come from a
+    static library, so each one is only parsed once
+    """
+    return tuple(_TEMPLATE_VAR_RE.findall(template))
+
+
+@lru_cache(maxsize=None)
+def template_categories() -> Tuple[str, ...]:
+    """List the template library's categories once; the library is static"""
+    return tuple(PromptEngineeringPlayground.get_prompt_templates())
+
+
+@lru_cache(maxsize=None)
+def template_names(category: str) -> Tuple[str, ...]:
+    """List the template names of a category once; the library is static"""
+    return tuple(PromptEngineeringPlayground.get_prompt_templates()[category])
+
+
 def create_streamlit_app():
     """
     Create an interactive Streamlit app for the Prompt Engineering Playground
@@ -31,9 +68,14 @@ def create_streamlit_app():
         """)
         return
 
+    use_cache = st.sidebar.checkbox(
+        "Reuse cached responses", value=True,
+        help="Answer repeated or near-identical prompts from the response cache instead of calling the API"
+    )
+
     # Initialize playground
     try:
-        playground = PromptEngineeringPlayground(api_key)
+        playground = get_playground(api_key, use_cache)
     except Exception as e:
         st.error(f"Error initializing playground: {str(e)}")
         return
@@ -63,12 +105,15 @@ def create_streamlit_app():
     """)
 
     # Mode-specific UI
-    if mode == "🎯 Single Technique":
-        show_single_technique_mode(playground)
-    elif mode == "🆚 Compare Techniques":
-        show_comparison_mode(playground)
-    else:
-        show_template_mode(playground)
+    try:
+        if mode == "🎯 Single Technique":
+            show_single_technique_mode(playground)
+        elif mode == "🆚 Compare Techniques":
+            show_comparison_mode(playground)
+        else:
+            show_template_mode(playground)
+    except Exception as e:
+        st.error(f"Request failed: {str(e)}")
 
 
 def show_single_technique_mode(playground):
@@ -77,19 +122,21 @@ def show_single_technique_mode(playground):
 
     technique = st.selectbox(
         "Select Prompting Technique",
-        list(playground.prompting_techniques.keys())
+        PromptEngineeringPlayground.TECHNIQUE_NAMES
     )
 
-    # Technique-specific inputs
+    # Technique-specific inputs; each lives in a form so typing does not
+    # rerun the page, only submitting does
     if technique == "Zero-Shot Prompting":
         st.markdown("**Zero-Shot**: No examples provided, testing model's base knowledge")
-        prompt = st.text_area("Enter your prompt", height=100)
 
-        if st.button("🚀 Generate", key="zero_shot"):
+        with st.form("form_zero_shot"):
+            prompt = st.text_area("Enter your prompt", height=100)
+            submitted = st.form_submit_button("🚀 Generate")
+
+        if submitted:
             if prompt:
-                with st.spinner("Generating response..."):
-                    result = playground.zero_shot_prompting(prompt)
-                    display_result(result, technique)
+                stream_result(playground, technique, prompt=prompt)
             else:
                 st.warning("Please enter a prompt")
 
@@ -97,66 +144,67 @@ def show_single_technique_mode(playground):
         st.markdown("**Few-Shot**: Provide examples to guide the model")
         st.markdown("**Example**: Translation task")
 
-        col1, col2 = st.columns(2)
-        with col1:
-            ex1_input = st.text_input("Example 1 Input", value="Translate to French: Hello")
-            ex1_output = st.text_input("Example 1 Output", value="Bonjour")
-        with col2:
-            ex2_input = st.text_input("Example 2 Input", value="Translate to French: Goodbye")
-            ex2_output = st.text_input("Example 2 Output", value="Au revoir")
+        with st.form("form_few_shot"):
+            col1, col2 = st.columns(2)
+            with col1:
+                ex1_input = st.text_input("Example 1 Input", value="Translate to French: Hello")
+                ex1_output = st.text_input("Example 1 Output", value="Bonjour")
+            with col2:
+                ex2_input = st.text_input("Example 2 Input", value="Translate to French: Goodbye")
+                ex2_output = st.text_input("Example 2 Output", value="Au revoir")
 
-        prompt = st.text_area("Your prompt", height=80)
+            prompt = st.text_area("Your prompt", height=80)
+            submitted = st.form_submit_button("🚀 Generate")
 
-        if st.button("🚀 Generate", key="few_shot"):
+        if submitted:
             if prompt:
-                with st.spinner("Generating response..."):
-                    examples = [
-                        {"input": ex1_input, "output": ex1_output},
-                        {"input": ex2_input, "output": ex2_output}
-                    ]
-                    result = playground.few_shot_prompting(prompt, examples)
-                    display_result(result, technique)
+                examples = [
+                    {"input": ex1_input, "output": ex1_output},
+                    {"input": ex2_input, "output": ex2_output}
+                ]
+                stream_result(playground, technique, prompt=prompt, examples=examples)
             else:
                 st.warning("Please enter a prompt")
 
     elif technique == "Chain-of-Thought Prompting":
         st.markdown("**Chain-of-Thought**: Break down complex reasoning step-by-step")
-        problem = st.text_area("Enter a problem requiring reasoning", height=100,
-                               placeholder="Example: If a train travels 120 miles in 2 hours, how fast is it going in miles per minute?")
 
-        if st.button("🚀 Solve", key="cot"):
+        with st.form("form_cot"):
+            problem = st.text_area("Enter a problem requiring reasoning", height=100,
+                                   placeholder="Example: If a train travels 120 miles in 2 hours, how fast is it going in miles per minute?")
+            submitted = st.form_submit_button("🚀 Solve")
+
+        if submitted:
             if problem:
-                with st.spinner("Solving step-by-step..."):
-                    result = playground.chain_of_thought_prompting(problem)
-                    display_result(result, technique)
+                stream_result(playground, technique, problem=problem)
             else:
                 st.warning("Please enter a problem")
 
     elif technique == "Role-Playing Prompting":
         st.markdown("**Role-Playing**: Assign a specific role to the AI")
 
-        role = st.text_input("Role", placeholder="Example: experienced software engineer, marketing expert, historian")
-        task = st.text_area("Task", height=100, placeholder="What should they help with?")
+        with st.form("form_role"):
+            role = st.text_input("Role", placeholder="Example: experienced software engineer, marketing expert, historian")
+            task = st.text_area("Task", height=100, placeholder="What should they help with?")
+            submitted = st.form_submit_button("🚀 Generate")
 
-        if st.button("🚀 Generate", key="role"):
+        if submitted:
             if role and task:
-                with st.spinner(f"Generating as {role}..."):
-                    result = playground.role_playing_prompting(role, task)
-                    display_result(result, technique)
+                stream_result(playground, technique, role=role, task=task)
             else:
                 st.warning("Please enter both role and task")
 
     elif technique == "Persona-Based Prompting":
         st.markdown("**Persona-Based**: Use a specific persona with unique characteristics")
 
-        persona = st.text_input("Persona", placeholder="Example: enthusiastic teacher who loves analogies")
-        query = st.text_area("Query", height=100)
+        with st.form("form_persona"):
+            persona = st.text_input("Persona", placeholder="Example: enthusiastic teacher who loves analogies")
+            query = st.text_area("Query", height=100)
+            submitted = st.form_submit_button("🚀 Generate")
 
-        if st.button("🚀 Generate", key="persona"):
+        if submitted:
             if persona and query:
-                with st.spinner("Generating response..."):
-                    result = playground.persona_based_prompting(persona, query)
-                    display_result(result, technique)
+                stream_result(playground, technique, persona=persona, query=query)
             else:
                 st.warning("Please enter both persona and query")
 
@@ -164,23 +212,25 @@ def show_single_technique_mode(playground):
         st.markdown("**ReAct**: Reasoning + Acting framework for problem-solving")
         st.markdown("*The model will think, act, and observe iteratively*")
 
-        task = st.text_area("Task", height=100, placeholder="Example: Plan a trip to Paris for 3 days")
+        with st.form("form_react"):
+            task = st.text_area("Task", height=100, placeholder="Example: Plan a trip to Paris for 3 days")
+            submitted = st.form_submit_button("🚀 Generate")
 
-        if st.button("🚀 Generate", key="react"):
+        if submitted:
             if task:
-                with st.spinner("Using ReAct framework..."):
-                    result = playground.react_prompting(task)
-                    display_result(result, technique)
+                stream_result(playground, technique, task=task)
             else:
                 st.warning("Please enter a task")
 
     elif technique == "Self-Consistency Prompting":
         st.markdown("**Self-Consistency**: Generate multiple reasoning paths and find consensus")
 
-        problem = st.text_area("Problem", height=100)
-        num_paths = st.slider("Number of reasoning paths", 2, 5, 3)
+        with st.form("form_self_cons"):
+            problem = st.text_area("Problem", height=100)
+            num_paths = st.slider("Number of reasoning paths", 2, 5, 3)
+            submitted = st.form_submit_button("🚀 Generate")
 
-        if st.button("🚀 Generate", key="self_cons"):
+        if submitted:
             if problem:
                 with st.spinner(f"Generating {num_paths} reasoning paths..."):
                     result = playground.self_consistency_prompting(problem, num_paths)
@@ -191,14 +241,14 @@ def show_single_technique_mode(playground):
     elif technique == "Tree-of-Thoughts Prompting":
         st.markdown("**Tree-of-Thoughts**: Explore multiple solution branches before selecting the best")
 
-        problem = st.text_area("Complex Problem", height=100,
-                               placeholder="Example: Design a sustainable urban transportation system")
+        with st.form("form_tot"):
+            problem = st.text_area("Complex Problem", height=100,
+                                   placeholder="Example: Design a sustainable urban transportation system")
+            submitted = st.form_submit_button("🚀 Generate")
 
-        if st.button("🚀 Generate", key="tot"):
+        if submitted:
             if problem:
-                with st.spinner("Exploring solution tree..."):
-                    result = playground.tree_of_thoughts_prompting(problem)
-                    display_result(result, technique)
+                stream_result(playground, technique, problem=problem)
             else:
                 st.warning("Please enter a problem")
 
@@ -213,40 +263,48 @@ def show_comparison_mode(playground):
 
     techniques = st.multiselect(
         "Select techniques to compare",
-        list(playground.prompting_techniques.keys()),
+        PromptEngineeringPlayground.TECHNIQUE_NAMES,
         default=["Zero-Shot Prompting", "Few-Shot Prompting", "Chain-of-Thought Prompting"]
     )
 
     if st.button("🆚 Compare", key="compare"):
         if prompt and techniques:
+            # One slot per technique, filled in as each result arrives
+            metrics = st.empty()
+            slots = {tech: st.empty() for tech in techniques}
+            total_tokens = 0
+            total_cost = 0.0
+
             with st.spinner("Comparing techniques..."):
-                result = playground.compare_techniques(prompt, techniques)
+                for tech, res in playground.iter_compare_techniques(prompt, techniques):
+                    with slots[tech].container():
+                        st.markdown(f"### {tech}")
+                        if 'error' in res:
+                            st.error(f"Error: {res['error']}")
+                        else:
+                            st.write(res.get('response', 'No response'))
 
-                # Display comparison
-                st.success(f"✅ Compared {result['techniques_compared']} techniques")
+                            col1, col2 = st.columns(2)
+                            with col1:
+                                st.caption(f"Tokens: {res.get('tokens', 0)}")
+                            with col2:
+                                st.caption(f"Cost: ${res.get('cost', 0.0)}")
+
+                            total_tokens += res.get('tokens', 0)
+                            total_cost += res.get('cost', 0.0)
+
+                        st.markdown("---")
+
+            # Display comparison
+            with metrics.container():
+                st.success(f"✅ Compared {len(techniques)} techniques")
 
                 # Show metrics
                 col1, col2 = st.columns(2)
                 with col1:
-                    st.metric("Total Tokens", result['total_tokens'])
+                    st.metric("Total Tokens", total_tokens)
                 with col2:
-                    st.metric("Total Cost", f"${result['total_cost']}")
-
-                # Show each result
-                for tech, res in result['results'].items():
-                    st.markdown(f"### {tech}")
-                    if 'error' in res:
-                        st.error(f"Error: {res['error']}")
-                    else:
-                        st.write(res.get('response', 'No response'))
-
-                        col1, col2 = st.columns(2)
-                        with col1:
-                            st.caption(f"Tokens: {res.get('tokens', 0)}")
-                        with col2:
-                            st.caption(f"Cost: ${res.get('cost', 0.0)}")
-
-                    st.markdown("---")
+                    st.metric("Total Cost", f"${round(total_cost, 6)}")
         else:
             st.warning("Please enter a prompt and select techniques")
 
@@ -258,34 +316,43 @@ def show_template_mode(playground):
 
     templates = playground.get_prompt_templates()
 
-    category = st.selectbox("Select Category", list(templates.keys()))
-    template_name = st.selectbox("Select Template", list(templates[category].keys()))
+    category = st.selectbox("Select Category", template_categories())
+    template_name = st.selectbox("Select Template", template_names(category))
 
     # Show template
     template = templates[category][template_name]
     st.code(template, language="text")
 
     # Extract variables from template
-    import re
-    variables = re.findall(r'\{(\w+)\}', template)
+    variables = template_variables(template)
 
     if variables:
         st.markdown("### Fill in the variables:")
-        var_values = {}
-        for var in variables:
-            var_values[var] = st.text_input(f"{var.replace('_', ' ').title()}", key=f"var_{var}")
-
-        if st.button("🎨 Create Prompt", key="template"):
-            prompt = playground.use_template(category, template_name, **var_values)
+        with st.form("form_template"):
+            var_values = {}
+            for var in variables:
+                var_values[var] = st.text_input(f"{var.replace('_', ' ').title()}", key=f"var_{var}")
+            created = st.form_submit_button("🎨 Create Prompt")
+
+        # The created prompt is kept in session state, per template, so it
+        # survives the rerun triggered by the run form below
+        prompt_key = f"prompt_{category}_{template_name}"
+        if created:
+            st.session_state[prompt_key] = playground.use_template(category, template_name, **var_values)
+
+        prompt = st.session_state.get(prompt_key)
+        if prompt:
             st.success("✅ Prompt created!")
             st.code(prompt, language="text")
 
             # Option to run with selected technique
             st.markdown("### Run with technique:")
-            technique = st.selectbox("Select Technique",
-                                   ["Zero-Shot Prompting", "Chain-of-Thought Prompting"])
+            with st.form("form_run_template"):
+                technique = st.selectbox("Select Technique",
+                                       ["Zero-Shot Prompting", "Chain-of-Thought Prompting"])
+                run = st.form_submit_button("🚀 Run")
 
-            if st.button("🚀 Run", key="run_template"):
+            if run:
                 with st.spinner("Generating..."):
                     if technique == "Zero-Shot Prompting":
                         result = playground.zero_shot_prompting(prompt)
@@ -297,30 +364,47 @@ def show_template_mode(playground):
 
 def display_result(result, technique):
     """Display result with metrics"""
-    if 'error' in result or (isinstance(result, dict) and 'response' in result):
+    if isinstance(result, dict) and 'error' in result:
+        st.error(f"{result.get('error_type', 'Error')}: {result['error']}")
+    elif isinstance(result, dict) and 'response' in result:
         response = result.get('response', str(result))
 
         st.markdown("### 💬 Response:")
         st.write(response)
 
-        if 'tokens' in result and 'cost' in result:
-            st.markdown("### 📊 Metrics:")
-            col1, col2, col3 = st.columns(3)
-
-            with col1:
-                st.metric("Tokens Used", result['tokens'])
-            with col2:
-                st.metric("Cost (USD)", f"${result['cost']}")
-            with col3:
-                st.metric("Technique", technique)
-
-            # Additional metrics for special techniques
-            if 'num_paths' in result:
-                st.metric("Reasoning Paths", result['num_paths'])
+        display_metrics(result, technique)
     else:
         st.write(result)
 
 
+def stream_result(playground, technique, **params):
+    """Render a technique's response as it is generated, then its metrics"""
+    st.markdown("### 💬 Response:")
+    result = {}
+    st.write_stream(playground.stream_technique(technique, result=result, **params))
+    display_metrics(result, technique)
+
+
+def display_metrics(result, technique):
+    """Display token and cost metrics for a result"""
+    if 'tokens' in result and 'cost' in result:
+        st.markdown("### 📊 Metrics:")
+        col1, col2, col3 = st.columns(3)
+
+        with col1:
+            st.metric("Tokens Used", result['tokens'])
+        with col2:
+            st.metric("Cost (USD)", f"${result['cost']}")
+        with col3:
+            st.metric("Technique", technique)
+
+        # Additional metrics for special techniques
+        if 'num_paths' in result:
+            st.metric("Reasoning Paths", result['num_paths'])
+        if result.get('cached'):
+            st.caption("⚡ Served from the response cache, no API call was made")
+
+
 def main():
     create_streamlit_app()
 
@@ -0,0 +1,119 @@
+import asyncio
+import os
+from types import SimpleNamespace
+
+import pytest
+from openai.types.chat import ChatCompletion, ChatCompletionChunk
+
+from src.prompt_playground import PromptEngineeringPlayground, SemanticCache
+
+
+def make_completion(content="answer", n=1, total_tokens=15):
+    """Serialized chat completion as returned by the API"""
+    return {
+        "id": "chatcmpl-test",
+        "object": "chat.completion",
+        "created": 0,
+        "model": "gpt-3.5-turbo",
+        "choices": [
+            {"index": i, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}
+            for i in range(n)
+        ],
+        "usage": {"prompt_tokens": total_tokens - 5, "completion_tokens": 5, "total_tokens": total_tokens}
+    }
+
+
+class FakeStream:
+    """Async stream of completion chunks ending with a usage-only chunk"""
+
+    def __init__(self, parts):
+        self.chunks = [
+            ChatCompletionChunk.model_validate({
+                "id": "chatcmpl-test", "object": "chat.completion.chunk", "created": 0, "model": "gpt-3.5-turbo",
+                "choices": [{"index": 0, "delta": {"content": part},
+                             "finish_reason": "stop" if i == len(parts) - 1 else None}]
+            })
+            for i, part in enumerate(parts)
+        ]
+        self.chunks.append(ChatCompletionChunk.model_validate({
+            "id": "chatcmpl-test", "object": "chat.completion.chunk", "created": 0, "model": "gpt-3.5-turbo",
+            "choices": [], "usage": {"prompt_tokens": 7, "completion_tokens": 2, "total_tokens": 9}
+        }))
+        self.closed = False
+
+    async def _iterate(self):
+        for chunk in self.chunks:
+            await asyncio.sleep(0)
+            yield chunk
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeCompletions:
+    """Stand-in for ``aclient.chat.completions`` that records every request"""
+
+    def __init__(self):
+        self.calls = []
+        self.delay = 0.01
+        self.error = None
+        self.content = "answer"
+        self.stream_parts = ["Hel", "lo"]
+
+    async def create(self, **kwargs):
+        self.calls.append(kwargs)
+        await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        if kwargs.get("stream"):
+            return FakeStream(self.stream_parts)
+        return ChatCompletion.model_validate(make_completion(self.content, n=kwargs.get("n", 1)))
+
+
+class FakeEmbeddings:
+    """Stand-in for ``aclient.embeddings``; texts map to fixed vectors"""
+
+    def __init__(self):
+        self.calls = []
+        self.vectors = {}
+        self.error = None
+
+    async def create(self, model, input):
+        self.calls.append(input)
+        if self.error is not None:
+            raise self.error
+        vector = self.vectors.get(input, [1.0, 0.0, 0.0])
+        return SimpleNamespace(data=[SimpleNamespace(embedding=vector)])
+
+
+@pytest.fixture
+def playground(tmp_path, monkeypatch):
+    """Playground working in a temporary directory with faked OpenAI clients"""
+    monkeypatch.chdir(tmp_path)
+    os.makedirs("outputs", exist_ok=True)
+
+    playground = PromptEngineeringPlayground("sk-test", use_cache=False)
+    playground.cache = SemanticCache(path=str(tmp_path / "cache.jsonl"))
+
+    fake = SimpleNamespace(
+        chat=SimpleNamespace(completions=FakeCompletions()),
+        embeddings=FakeEmbeddings()
+    )
+    playground.aclient = fake
+    playground._executor.client = fake
+
+    yield playground
+    playground.close()
+
+
+@pytest.fixture
+def completions(playground):
+    return playground.aclient.chat.completions
+
+
+@pytest.fixture
+def embeddings(playground):
+    return playground.aclient.embeddings
@@ -0,0 +1,407 @@
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+
+import httpx
+import numpy as np
+import openai
+import pytest
+
+from src import prompt_playground
+from src.prompt_playground import DemoResult, SemanticCache, ThrottledOpenAIExecutor, TokenBucket
+from tests.conftest import FakeCompletions, FakeStream, make_completion
+
+
+def _bad_request():
+    request = httpx.Request("POST", "https://api.openai.com/v1/embeddings")
+    return openai.BadRequestError("input too long", response=httpx.Response(400, request=request), body=None)
+
+
+def _request(content, system="You are a helpful assistant."):
+    return {
+        "model": "gpt-3.5-turbo",
+        "messages": [{"role": "system", "content": system}, {"role": "user", "content": content}]
+    }
+
+
+def test_exact_hit_skips_the_api_and_reports_no_cost(playground, completions):
+    first = playground.zero_shot_prompting("hello")
+    second = playground.zero_shot_prompting("hello")
+
+    assert len(completions.calls) == 1
+    assert first["tokens"] == 15 and first["cost"] > 0
+    assert "cached" not in first
+    assert second == {"response": "answer", "tokens": 0, "cost": 0.0, "cached": True}
+
+
+def test_similar_final_turn_is_a_semantic_hit(playground, completions, embeddings):
+    embeddings.vectors = {"hello": [1.0, 0.0, 0.0], "hello!": [0.99, 0.05, 0.0]}
+
+    playground.zero_shot_prompting("hello")
+    result = playground.zero_shot_prompting("hello!")
+
+    assert len(completions.calls) == 1
+    assert result["response"] == "answer" and result["tokens"] == 0
+
+
+def test_semantic_hits_do_not_cross_techniques(playground, completions):
+    playground.zero_shot_prompting("same text")
+    playground.chain_of_thought_prompting("same text")
+
+    assert len(completions.calls) == 2
+
+
+def test_dissimilar_final_turn_is_a_miss(playground, completions, embeddings):
+    embeddings.vectors = {"cats": [1.0, 0.0, 0.0], "taxes": [0.0, 1.0, 0.0]}
+
+    playground.zero_shot_prompting("cats")
+    playground.zero_shot_prompting("taxes")
+
+    assert len(completions.calls) == 2
+
+
+def test_embedding_failure_falls_back_to_the_completion(playground, completions, embeddings):
+    embeddings.error = _bad_request()
+
+    result = playground.zero_shot_prompting("hello")
+
+    assert result["response"] == "answer"
+    assert len(completions.calls) == 1
+
+
+def test_embeddings_share_the_concurrency_limit(playground, embeddings):
+    playground._executor.max_concurrency = 2
+    in_flight = peak = 0
+    create = embeddings.create
+
+    async def tracked_create(model, input):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return await create(model, input)
+
+    embeddings.create = tracked_create
+    playground.few_shot_batch([f"prompt {i}" for i in range(10)])
+
+    assert len(embeddings.calls) == 10
+    assert peak <= 2
+
+
+def test_rate_limited_embedding_is_not_retried(playground, completions, embeddings):
+    request = httpx.Request("POST", "https://api.openai.com/v1/embeddings")
+    embeddings.error = openai.RateLimitError("slow down", response=httpx.Response(429, request=request), body=None)
+
+    assert playground.zero_shot_prompting("hello")["response"] == "answer"
+    assert len(embeddings.calls) == 1
+
+
+def test_final_turn_over_the_embedding_limit_skips_the_semantic_tier(playground, completions, embeddings, monkeypatch):
+    monkeypatch.setattr(prompt_playground, "_MAX_EMBEDDING_TOKENS", 3)
+
+    result = playground.zero_shot_prompting("a prompt well past the tiny embedding limit")
+
+    assert result["response"] == "answer"
+    assert embeddings.calls == []
+
+
+def test_multi_sample_requests_bypass_the_cache(playground, completions):
+    playground.self_consistency_prompting("2+2", 3)
+    playground.self_consistency_prompting("2+2", 3)
+
+    assert len(completions.calls) == 2
+    assert playground.cache.exact == {}
+
+
+def test_cache_reloads_from_disk(tmp_path):
+    path = str(tmp_path / "cache.jsonl")
+    request = _request("hello")
+    embedding = np.array([1.0, 0.0], dtype=np.float32)
+
+    SemanticCache(path=path).add(request, embedding, make_completion())
+    reloaded = SemanticCache(path=path)
+
+    assert reloaded.get_exact(request) == make_completion()
+    assert reloaded.get_similar(_request("hello again"), embedding) == make_completion()
+    assert reloaded.get_similar(_request("hello", system="Other"), embedding) is None
+
+
+def test_cache_keeps_one_entry_per_request(tmp_path):
+    path = tmp_path / "cache.jsonl"
+    cache = SemanticCache(path=str(path))
+    embedding = np.array([1.0, 0.0], dtype=np.float32)
+
+    cache.add(_request("hello"), embedding, make_completion("first"))
+    cache.add(_request("hello"), embedding, make_completion("second"))
+
+    assert len(path.read_text().splitlines()) == 1
+    assert sum(len(entries) for entries in cache.entries.values()) == 1
+    assert cache.get_exact(_request("hello"))["choices"][0]["message"]["content"] == "first"
+
+
+def test_request_is_tokenized_and_keyed_once(playground, monkeypatch):
+    calls = []
+    count_messages_tokens = prompt_playground.count_messages_tokens
+    keys = SemanticCache.keys
+    monkeypatch.setattr(prompt_playground, "count_messages_tokens",
+                        lambda messages: calls.append("tokens") or count_messages_tokens(messages))
+    monkeypatch.setattr(SemanticCache, "keys", staticmethod(lambda request: calls.append("keys") or keys(request)))
+
+    playground.zero_shot_prompting("hello")
+    list(playground.stream_technique("Zero-Shot Prompting", prompt="hello again"))
+
+    assert calls == ["tokens", "keys"] * 2
+
+
+def test_token_bucket_waits_for_refill():
+    async def spend():
+        bucket = TokenBucket(rate=100, capacity=10)
+        await bucket.acquire(10)
+        start = time.monotonic()
+        await bucket.acquire(5)
+        return time.monotonic() - start
+
+    assert asyncio.run(spend()) >= 0.04
+
+
+def _executor():
+    completions = FakeCompletions()
+    client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    return ThrottledOpenAIExecutor(client, 3500, 90000, 10), completions
+
+
+def test_token_budget_scales_with_the_sample_count():
+    executor, _ = _executor()
+    executor._tokens = TokenBucket(rate=1e-6, capacity=90000)
+
+    asyncio.run(executor.create(10, **_request("hello"), n=4))
+    asyncio.run(executor.create(10, **_request("hello"), max_tokens=100))
+
+    spent = 90000 - executor._tokens.tokens
+    assert spent == pytest.approx(10 + 4 * prompt_playground._DEFAULT_COMPLETION_TOKENS + 10 + 100)
+
+
+def test_identical_in_flight_requests_share_one_call():
+    executor, completions = _executor()
+
+    async def run():
+        return await asyncio.gather(*(executor.create(10, **_request("hello")) for _ in range(5)))
+
+    responses = asyncio.run(run())
+
+    assert len(completions.calls) == 1
+    assert all(response is responses[0] for response in responses)
+    assert executor._inflight == {}
+
+
+def test_cancelling_the_first_caller_does_not_cancel_the_others():
+    executor, completions = _executor()
+
+    async def run():
+        owner = asyncio.ensure_future(executor.create(10, **_request("hello")))
+        await asyncio.sleep(0)
+        waiter = asyncio.ensure_future(executor.create(10, **_request("hello")))
+        await asyncio.sleep(0)
+        owner.cancel()
+        return owner, await waiter
+
+    owner, response = asyncio.run(run())
+
+    assert owner.cancelled()
+    assert response.choices[0].message.content == "answer"
+    assert len(completions.calls) == 1
+
+
+def test_a_failed_shared_call_raises_for_every_caller():
+    executor, completions = _executor()
+    completions.error = ValueError("boom")
+
+    async def run():
+        return await asyncio.gather(
+            *(executor.create(10, **_request("hello")) for _ in range(3)),
+            return_exceptions=True
+        )
+
+    results = asyncio.run(run())
+
+    assert [type(result) for result in results] == [ValueError] * 3
+    assert executor._inflight == {}
+
+
+def test_few_shot_batch_coalesces_duplicates_and_stores_them_once(playground, completions, tmp_path):
+    results = playground.few_shot_batch(["a"] * 5)
+
+    assert [result["response"] for result in results] == ["answer"] * 5
+    assert len(completions.calls) == 1
+    assert len((tmp_path / "cache.jsonl").read_text().splitlines()) == 1
+
+
+def test_sync_api_works_inside_a_running_loop(playground):
+    async def call_from_async_code():
+        return playground.zero_shot_prompting("hello")
+
+    assert asyncio.run(call_from_async_code())["response"] == "answer"
+
+
+def test_stream_reports_usage_and_caches_the_completion(playground, completions):
+    result = {}
+    fragments = list(playground.stream_technique("Zero-Shot Prompting", result=result, prompt="hello"))
+
+    assert fragments == ["Hel", "lo"]
+    assert result["response"] == "Hello" and result["tokens"] == 9
+
+    replayed = {}
+    assert list(playground.stream_technique("Zero-Shot Prompting", result=replayed, prompt="hello")) == ["Hello"]
+    assert replayed == {"response": "Hello", "tokens": 0, "cost": 0.0, "cached": True}
+    assert playground.zero_shot_prompting("hello")["response"] == "Hello"
+    assert len(completions.calls) == 1
+
+
+def test_abandoned_stream_is_not_cached(playground):
+    fragments = playground.stream_technique("Zero-Shot Prompting", prompt="hello")
+    assert next(fragments) == "Hel"
+    fragments.close()
+
+    assert playground.cache.exact == {}
+
+
+def test_empty_stream_reports_an_empty_response(playground, completions):
+    stream = FakeStream([])
+    stream.chunks = []
+    create = completions.create
+
+    async def empty_create(**kwargs):
+        await create(**kwargs)
+        return stream
+
+    completions.create = empty_create
+    result = {}
+
+    assert list(playground.stream_technique("Zero-Shot Prompting", result=result, prompt="hello")) == []
+    assert result == {"response": "", "tokens": 0, "cost": 0.0}
+    assert playground.cache.exact == {} and stream.closed
+
+
+def test_stream_retry_does_not_hold_a_concurrency_slot(playground, completions):
+    playground._executor.max_concurrency = 1
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    completions.error = openai.APIConnectionError(request=request)
+    seen_free_slot = []
+
+    async def run():
+        fragments = playground._executor.stream(10, **_request("hello"))
+        opening = asyncio.ensure_future(fragments.__anext__())
+        await asyncio.sleep(0.1)  # first attempt failed, the retry is backing off
+        seen_free_slot.append(not playground._executor._sem.locked())
+        opening.cancel()
+
+    playground._run_sync(run())
+
+    assert seen_free_slot == [True]
+
+
+def test_self_consistency_cannot_be_streamed(playground):
+    with pytest.raises(ValueError):
+        list(playground.stream_technique("Self-Consistency Prompting", problem="2+2"))
+
+
+def _batch_record(custom_id, status_code=200, body=None, error=None):
+    response = None if error else {"status_code": status_code, "body": body}
+    return json.dumps({"custom_id": custom_id, "response": response, "error": error})
+
+
+def _fake_batch_client(output_lines, error_lines):
+    files = {"out": "\n".join(output_lines) + "\n", "err": "\n".join(error_lines) + "\n"}
+    return SimpleNamespace(
+        files=SimpleNamespace(
+            create=lambda file, purpose: SimpleNamespace(id="file-input"),
+            content=lambda file_id: SimpleNamespace(text=files[file_id])
+        ),
+        batches=SimpleNamespace(
+            create=lambda **kwargs: SimpleNamespace(id="batch-1"),
+            retrieve=lambda batch_id: SimpleNamespace(status="completed", output_file_id="out", error_file_id="err")
+        )
+    )
+
+
+def test_batch_results_are_ordered_and_errors_mapped(playground, tmp_path):
+    playground.client = _fake_batch_client(
+        [
+            _batch_record("2_zero-shot_prompting", body=make_completion("third")),
+            _batch_record("0_zero-shot_prompting", body=make_completion("first")),
+        ],
+        [
+            _batch_record("1_chain-of-thought_prompting", 400, {"error": {"message": "bad", "code": "invalid"}}),
+            _batch_record("3_react_prompting", error={"code": "batch_expired", "message": "expired"}),
+        ]
+    )
+    demos = [
+        {"technique": "Zero-Shot Prompting", "params": {"prompt": "one"}},
+        {"technique": "Chain-of-Thought Prompting", "params": {"problem": "two"}},
+        {"technique": "Zero-Shot Prompting", "params": {"prompt": "three"}},
+        {"technique": "ReAct Prompting", "params": {"task": "four"}},
+    ]
+
+    results = playground.run_demonstrations_batch(demos)
+
+    assert [result.input for result in results] == [demo["params"] for demo in demos]
+    assert results[0].response == "first" and results[2].response == "third"
+    assert results[0].cost == playground.calculate_cost(15, batch=True) < playground.calculate_cost(15)
+    assert (results[1].error, results[1].error_type) == ("bad", "invalid")
+    assert (results[3].error, results[3].error_type) == ("expired", "batch_expired")
+
+
+def test_batch_results_are_saved_to_the_demo_log(playground, tmp_path):
+    playground.client = _fake_batch_client([_batch_record("0_zero-shot_prompting", body=make_completion("first"))], [])
+
+    results = playground.run_demonstrations_batch([{"technique": "Zero-Shot Prompting", "params": {"prompt": "one"}}])
+
+    logged = (tmp_path / "outputs" / "demos.jsonl").read_text().splitlines()
+    assert [json.loads(line) for line in logged] == [result.to_dict() for result in results]
+
+
+def test_demo_result_serializes_in_the_log_shape():
+    success = DemoResult("Zero-Shot Prompting", {"prompt": "hi"}, response="hello", tokens=3, cost=0.1)
+    failure = DemoResult.from_output("ReAct Prompting", {"task": "t"}, prompt_playground._error_result(ValueError("x")))
+    paths = DemoResult("Self-Consistency Prompting", {}, response="r", num_paths=3)
+
+    assert success.to_dict() == {
+        "technique": "Zero-Shot Prompting",
+        "input": {"prompt": "hi"},
+        "output": {"response": "hello", "tokens": 3, "cost": 0.1}
+    }
+    assert failure.to_dict()["output"] == {"error": "x", "error_type": "ValueError", "tokens": 0, "cost": 0.0}
+    assert paths.to_dict()["output"]["num_paths"] == 3
+
+
+def test_demonstrations_are_appended_to_the_log(playground, tmp_path):
+    log = tmp_path / "outputs" / "demos.jsonl"
+    assert not log.exists()
+
+    playground.run_demonstrations([
+        {"technique": "Zero-Shot Prompting", "params": {"prompt": "one"}},
+        {"technique": "Unknown", "params": {}},
+    ])
+    playground.run_demonstration("ReAct Prompting", pretty=True, task="two")
+
+    assert len(log.read_text().splitlines()) == 2
+    assert (tmp_path / "outputs" / "react_prompting_demo.json").exists()
+
+
+def test_truncated_cache_line_is_skipped(tmp_path):
+    path = tmp_path / "cache.jsonl"
+    SemanticCache(path=str(path)).add(_request("hello"), None, make_completion())
+    with open(path, "a") as f:
+        f.write('{"key": "trunc')
+
+    assert SemanticCache(path=str(path)).get_exact(_request("hello")) == make_completion()
+
+
+def test_cache_write_failure_still_returns_the_answer(playground, embeddings, tmp_path):
+    embeddings.vectors = {"hello": [1.0, 0.0, 0.0], "hi": [0.0, 1.0, 0.0]}
+    playground.cache.path = str(tmp_path / "missing" / "cache.jsonl")
+
+    assert playground.zero_shot_prompting("hello")["response"] == "answer"
+    assert list(playground.stream_technique("Zero-Shot Prompting", prompt="hi")) == ["Hel", "lo"]
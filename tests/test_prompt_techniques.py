@@ -0,0 +1,100 @@
+import pytest
+
+from src import prompt_playground
+from src.prompt_playground import PromptEngineeringPlayground, _compile_template, _fill_template
+
+
+def test_compile_template_splits_around_the_placeholder():
+    assert _compile_template("You are a {role}.") == ("You are a ", "role", ".")
+    assert _compile_template("No placeholder") == ("No placeholder", None, "")
+
+
+def test_fill_template_concatenates_the_parameter():
+    assert _fill_template(_compile_template("You are a {role}."), {"role": "poet"}) == "You are a poet."
+    assert _fill_template(_compile_template("{prompt}"), {"prompt": "hi"}) == "hi"
+    assert _fill_template(_compile_template("Fixed"), {}) == "Fixed"
+
+
+def test_fixed_instructions_precede_the_variable_part(playground):
+    request = playground._technique_request("Role-Playing Prompting", role="historian", task="Explain Rome")
+    system, user = request["messages"]
+
+    assert system["content"].startswith("Respond as if you were truly in the role below")
+    assert system["content"].endswith("You are a historian.")
+    assert user == {"role": "user", "content": "Explain Rome"}
+
+
+def test_constant_system_messages_are_shared(playground):
+    first = playground._technique_request("Chain-of-Thought Prompting", problem="a")
+    second = playground._technique_request("Chain-of-Thought Prompting", problem="b")
+
+    assert first["messages"][0] is second["messages"][0]
+
+
+def test_self_consistency_samples_every_path_in_one_request(playground):
+    request = playground._technique_request("Self-Consistency Prompting", problem="2+2", num_samples=4)
+
+    assert request["n"] == 4
+    assert request["temperature"] == 0.7
+
+
+def test_unknown_technique_is_rejected(playground):
+    with pytest.raises(ValueError):
+        playground._technique_request("Telepathic Prompting", prompt="hi")
+
+
+def test_few_shot_drops_the_oldest_examples_to_fit(playground, monkeypatch):
+    monkeypatch.setattr(prompt_playground, "_MAX_PROMPT_TOKENS", 60)
+    examples = [{"input": f"input {i} " * 5, "output": f"output {i}"} for i in range(4)]
+
+    messages = playground._technique_request("Few-Shot Prompting", prompt="translate", examples=examples)["messages"]
+
+    assert messages[-1] == {"role": "user", "content": "translate"}
+    assert prompt_playground.count_messages_tokens(messages) < 60
+    kept = [message["content"] for message in messages if message["role"] == "assistant"]
+    assert kept and kept == [f"output {i}" for i in range(4 - len(kept), 4)]
+
+
+def test_prompt_over_the_limit_fails_before_any_call(playground, completions, monkeypatch):
+    monkeypatch.setattr(prompt_playground, "_MAX_PROMPT_TOKENS", 10)
+
+    with pytest.raises(ValueError):
+        playground.zero_shot_prompting("a prompt that is much longer than ten tokens once the system message is added")
+    assert completions.calls == []
+
+
+def test_compare_reports_unknown_techniques_and_totals_the_rest(playground):
+    result = playground.compare_techniques("hello", ["Zero-Shot Prompting", "Telepathic Prompting"])
+
+    assert result["techniques_compared"] == 2
+    assert result["results"]["Zero-Shot Prompting"]["response"] == "answer"
+    assert "error" in result["results"]["Telepathic Prompting"]
+    assert result["total_tokens"] == 15
+
+
+def test_compare_runs_every_registered_technique(playground):
+    result = playground.compare_techniques("hello", list(PromptEngineeringPlayground.TECHNIQUE_NAMES))
+
+    assert all("error" not in outcome for outcome in result["results"].values())
+    assert result["results"]["Self-Consistency Prompting"]["num_paths"] == 3
+
+
+def test_iter_compare_yields_every_technique(playground):
+    techniques = ["Zero-Shot Prompting", "Chain-of-Thought Prompting", "Telepathic Prompting"]
+
+    results = dict(playground.iter_compare_techniques("hello", techniques))
+
+    assert set(results) == set(techniques)
+    assert "error" in results["Telepathic Prompting"]
+
+
+def test_technique_registry_lists_every_technique():
+    assert len(PromptEngineeringPlayground.TECHNIQUE_NAMES) == 8
+    for name, attr in PromptEngineeringPlayground._TECHNIQUE_METHODS:
+        assert callable(getattr(PromptEngineeringPlayground, attr))
+
+
+def test_use_template_fills_and_reports_missing_variables(playground):
+    assert playground.use_template("Analysis", "Compare", item1="tea", item2="coffee") == "Compare and contrast tea and coffee"
+    assert playground.use_template("Analysis", "Compare", item1="tea") == "Missing variable: 'item2'"
+    assert playground.use_template("Nope", "Compare") == "Category 'Nope' not found"